@@ -1,9 +1,9 @@
 """
 Generate audio files for specific task IDs
 """
-import json
 import asyncio
 import os
+import orjson
 from pathlib import Path
 from dotenv import load_dotenv
 from elevenlabs import ElevenLabs
@@ -13,6 +13,32 @@ load_dotenv()
 TASKS_FILE = Path(__file__).parent / "services" / "tasks.json"
 AUDIO_DIR = Path(__file__).parent / "services" / "audio"
 
+# Max ElevenLabs requests in flight at once
+MAX_CONCURRENT_GENERATIONS = 8
+
+# Shared ElevenLabs client so concurrent generations reuse one HTTP connection pool
+_client: ElevenLabs | None = None
+
+def _get_client() -> ElevenLabs:
+    global _client
+    if _client is None:
+        _client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+    return _client
+
+def _synthesize_to_file(client: ElevenLabs, pilot_message: str, filepath: Path):
+    """Blocking ElevenLabs call + file write, run in a worker thread."""
+    audio_generator = client.text_to_speech.convert(
+        voice_id="JBFqnCBsd6RMkjVDRZzb",
+        output_format="mp3_44100_128",
+        text=pilot_message,
+        model_id="eleven_multilingual_v2"
+    )
+    
+    # Stream chunks to file as they arrive
+    with open(filepath, 'wb') as f:
+        for chunk in audio_generator:
+            f.write(chunk)
+
 async def generate_audio_for_task_standalone(task_id: int, pilot_message: str) -> str | None:
     """Generate audio file for a task's pilot message using ElevenLabs TTS."""
     try:
@@ -21,23 +47,13 @@ async def generate_audio_for_task_standalone(task_id: int, pilot_message: str) -
             print(f"❌ ElevenLabs API key not found in environment")
             return None
         
-        client = ElevenLabs(api_key=api_key)
+        client = _get_client()
         filename = f"task_{task_id}.mp3"
         filepath = AUDIO_DIR / filename
         
-        # Generate audio
+        # Generate audio off the event loop so several tasks can synthesize at once
         print(f"🔊 Generating audio for task {task_id}...")
-        audio_generator = client.text_to_speech.convert(
-            voice_id="JBFqnCBsd6RMkjVDRZzb",
-            output_format="mp3_44100_128",
-            text=pilot_message,
-            model_id="eleven_multilingual_v2"
-        )
-        audio_data = b"".join(audio_generator)
-        
-        # Save to file
-        with open(filepath, 'wb') as f:
-            f.write(audio_data)
+        await asyncio.to_thread(_synthesize_to_file, client, pilot_message, filepath)
         
         print(f"✓ Audio saved: {filename}")
         return filename
@@ -50,8 +66,7 @@ async def generate_audio_for_ids(task_ids: list[int]):
     """Generate audio for specific task IDs"""
     
     # Load tasks
-    with open(TASKS_FILE, 'r') as f:
-        tasks = json.load(f)
+    tasks = orjson.loads(TASKS_FILE.read_bytes())
     
     # Find tasks with these IDs
     target_tasks = [t for t in tasks if t.get('id') in task_ids]
@@ -64,29 +79,37 @@ async def generate_audio_for_ids(task_ids: list[int]):
     for task in target_tasks:
         print(f"  - ID {task['id']}: {task.get('aircraft_callsign')} - {task.get('priority')} - {task.get('category')}")
     
-    # Generate audio for each task
-    generated_count = 0
+    # Generate audio for all tasks concurrently, bounded by a semaphore
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_GENERATIONS)
+    
+    async def generate_one(task: dict):
+        async with semaphore:
+            return task, await generate_audio_for_task_standalone(task['id'], task['pilot_message'])
+    
+    pending_tasks = []
     for task in target_tasks:
-        task_id = task['id']
-        pilot_message = task.get('pilot_message')
-        
-        if not pilot_message:
-            print(f"⚠️  Task {task_id} has no pilot_message, skipping")
+        if not task.get('pilot_message'):
+            print(f"⚠️  Task {task['id']} has no pilot_message, skipping")
             continue
-        
-        audio_filename = await generate_audio_for_task_standalone(task_id, pilot_message)
-        
+        pending_tasks.append(task)
+    
+    results = await asyncio.gather(*(generate_one(task) for task in pending_tasks))
+    
+    generated_count = 0
+    for task, audio_filename in results:
         if audio_filename:
             # Update the task in the JSON
             task['audio_file'] = audio_filename
             generated_count += 1
         else:
-            print(f"❌ Failed to generate audio for task {task_id}")
+            print(f"❌ Failed to generate audio for task {task['id']}")
     
     # Save updated tasks back to file
     if generated_count > 0:
-        with open(TASKS_FILE, 'w') as f:
-            json.dump(tasks, f, indent=2)
+        # Write to a temp file and rename so a crash never leaves a partial tasks.json
+        tmp_file = TASKS_FILE.with_suffix('.json.tmp')
+        tmp_file.write_bytes(orjson.dumps(tasks))
+        os.replace(tmp_file, TASKS_FILE)
         print(f"\n✓ Successfully generated {generated_count} audio files")
         print(f"✓ Updated {TASKS_FILE}")
     else:
@@ -101,4 +124,11 @@ if __name__ == "__main__":
     print("=" * 60)
     print(f"Target task IDs: {target_ids}\n")
     
+    # Use libuv's event loop when available (installed with uvicorn[standard])
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(generate_audio_for_ids(target_ids))
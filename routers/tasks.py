@@ -7,36 +7,49 @@ When the frontend calls this endpoint, it:
 2. get_active_tasks() loads tasks from tasks.json
 3. Returns only unresolved tasks to the frontend
 """
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
-from typing import List, Dict
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel
 import sys
+import asyncio
+import logging
 from pathlib import Path
+import orjson
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from services.analysis_service import get_active_tasks, run_analysis, load_tasks, save_tasks, AUDIO_DIR
+from services.analysis_service import (
+    get_active_tasks, invalidate_active_tasks, run_analysis, load_tasks, save_tasks, tasks_lock, AUDIO_DIR
+)
+from services.http_cache import etag_json_response
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/api/tasks",
     tags=["tasks"]
 )
 
+# Resolves mutate the shared in-memory task list under tasks_lock and mark it dirty;
+# persist_resolved_tasks() coalesces bursts of resolves into a single tasks.json write.
+TASKS_SAVE_DEBOUNCE_SECONDS = 0.05
+_tasks_dirty = asyncio.Event()
+
 
 class ResolveTaskRequest(BaseModel):
     task_id: int
 
 
 @router.get("/")
-async def get_tasks() -> List[Dict]:
+async def get_tasks(request: Request) -> Response:
     """
     Get active tasks for the frontend.
     This endpoint returns pre-analyzed tasks that are continuously updated in the background.
     No analysis runs on-demand - results are served instantly from the latest background analysis.
+    Responses carry an ETag so unchanged task lists come back as 304 Not Modified.
     
     Returns:
         List of active (unresolved) task dictionaries
@@ -44,12 +57,10 @@ async def get_tasks() -> List[Dict]:
     try:
         # Simply get active tasks - analysis runs continuously in background
         tasks = get_active_tasks()
-        print(f"📋 Returning {len(tasks)} active tasks to frontend")
-        return tasks
+        logger.debug("Returning %d active tasks to frontend", len(tasks))
+        return etag_json_response(request, orjson.dumps(tasks))
     except Exception as e:
-        print(f"❌ Error in get_tasks endpoint: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in get_tasks endpoint")
         raise HTTPException(status_code=500, detail=f"Error getting tasks: {str(e)}")
 
 
@@ -57,25 +68,30 @@ async def get_tasks() -> List[Dict]:
 async def resolve_task(request: ResolveTaskRequest):
     """
     Mark a task as resolved and remove it from active tasks.
+    The change is applied in memory and written to tasks.json shortly after
+    by persist_resolved_tasks().
     
     Args:
         request: Request containing task_id to resolve
     """
     try:
-        all_tasks = load_tasks()
-        task_found = False
-        
-        for task in all_tasks:
-            if task.get('id') == request.task_id:
-                task['resolved'] = True
-                task_found = True
-                print(f"✓ Task {request.task_id} marked as resolved")
-                break
-        
-        if not task_found:
-            raise HTTPException(status_code=404, detail=f"Task {request.task_id} not found")
+        async with tasks_lock:
+            all_tasks = load_tasks()
+            task_found = False
+            
+            for task in all_tasks:
+                if task.get('id') == request.task_id:
+                    task['resolved'] = True
+                    task_found = True
+                    logger.info("Task %s marked as resolved", request.task_id)
+                    break
+            
+            if not task_found:
+                raise HTTPException(status_code=404, detail=f"Task {request.task_id} not found")
+            
+            invalidate_active_tasks()
+            _tasks_dirty.set()
         
-        save_tasks(all_tasks)
         return {"status": "success", "task_id": request.task_id}
         
     except HTTPException:
@@ -95,13 +111,17 @@ async def get_task_audio(filename: str):
     try:
         filepath = AUDIO_DIR / filename
         
-        if not filepath.exists():
+        # Stat once and hand the result to FileResponse so it doesn't stat again
+        try:
+            stat_result = filepath.stat()
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Audio file not found")
         
         return FileResponse(
             path=filepath,
             media_type="audio/mpeg",
-            filename=filename
+            filename=filename,
+            stat_result=stat_result
         )
         
     except HTTPException:
@@ -110,4 +130,20 @@ async def get_task_audio(filename: str):
         raise HTTPException(status_code=500, detail=f"Error serving audio: {str(e)}")
 
 
-
+async def persist_resolved_tasks():
+    """
+    Background writer for resolve_task: waits for a resolve, debounces briefly so
+    a burst of resolves is written once, then saves tasks.json. Started from the
+    app lifespan; flushes any pending change when cancelled on shutdown.
+    """
+    try:
+        while True:
+            await _tasks_dirty.wait()
+            await asyncio.sleep(TASKS_SAVE_DEBOUNCE_SECONDS)
+            async with tasks_lock:
+                _tasks_dirty.clear()
+                await asyncio.to_thread(save_tasks, load_tasks())
+    except asyncio.CancelledError:
+        if _tasks_dirty.is_set():
+            save_tasks(load_tasks())
+        raise
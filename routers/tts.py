@@ -1,23 +1,40 @@
 """
 Router for ElevenLabs TTS endpoints
 """
+import hashlib
+import logging
+import redis.asyncio as redis
+from redis.exceptions import RedisError
 from fastapi import APIRouter
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
 from pydantic import BaseModel
 from services.tts_api import tts_api
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/api/tts",
     tags=["tts"]
 )
 
+# Synthesized audio is cached in Redis by text hash (raw bytes, so no decode_responses)
+TTS_CACHE_TTL_SECONDS = 86400  # 1 day
+tts_cache = redis.Redis(host='localhost', port=6379)
+
 class TTSRequest(BaseModel):
     text: str
 
+def tts_cache_key(text: str) -> str:
+    """Content-addressed Redis key for the audio of a given text"""
+    return "tts:" + hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
 @router.post("/speak")
 async def speak(request: TTSRequest):
     """
-    Convert text to speech and return audio file
+    Convert text to speech and stream the audio back as it is synthesized.
+    Repeated text is served straight from the Redis cache.
     
     Args:
         request: Request body containing text to convert
@@ -31,15 +48,50 @@ async def speak(request: TTSRequest):
                 headers={"X-Error": "ElevenLabs API key not configured"}
             )
         
-        audio_generator = tts_api.text_to_speech(request.text)
-        # Collect all audio chunks from the generator
-        audio_data = b"".join(audio_generator)
-        return Response(
-            content=audio_data,
-            media_type="audio/mpeg"
+        cache_key = tts_cache_key(request.text)
+        try:
+            cached_audio = await tts_cache.get(cache_key)
+        except RedisError as e:
+            logger.warning("TTS cache read failed: %s", e)
+            cached_audio = None
+        
+        if cached_audio:
+            return Response(
+                content=cached_audio,
+                media_type="audio/mpeg"
+            )
+        
+        audio_chunks = iter(tts_api.text_to_speech_stream(request.text))
+        # Pull the first chunk before responding so upstream errors still return a 500
+        first_chunk = await run_in_threadpool(next, audio_chunks, b"")
+
+        audio_buffer = bytearray(first_chunk)
+        stream_complete = False
+
+        async def stream_audio():
+            nonlocal stream_complete
+            yield first_chunk
+            async for chunk in iterate_in_threadpool(audio_chunks):
+                audio_buffer.extend(chunk)
+                yield chunk
+            stream_complete = True
+
+        async def cache_audio():
+            # Runs after the last chunk is sent; skip partial clips from dropped clients
+            if not stream_complete:
+                return
+            try:
+                await tts_cache.set(cache_key, bytes(audio_buffer), ex=TTS_CACHE_TTL_SECONDS)
+            except RedisError as e:
+                logger.warning("TTS cache write failed: %s", e)
+
+        return StreamingResponse(
+            stream_audio(),
+            media_type="audio/mpeg",
+            background=BackgroundTask(cache_audio)
         )
     except Exception as e:
-        print(f"TTS Error: {e}")
+        logger.error("TTS Error: %s", e)
         return Response(
             content=b"",
             media_type="audio/mpeg",
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, HTTPException
-from services.weather_api import AviationWeatherAPI
+from services.weather_api import weather_api
 
 router = APIRouter(
     prefix="/api/weather",
@@ -10,18 +10,39 @@ router = APIRouter(
 async def get_weather(station_id: str):
     station_id = station_id.upper()
 
-    metar = await AviationWeatherAPI().get_metar(station_id)
+    metar = await weather_api.get_metar(station_id)
 
     return metar
 
 @router.get("/sigmets")
 async def get_sigmets(hazard: str = None):
-    sigmets = await AviationWeatherAPI().get_sigmets(hazard)
+    sigmets = await weather_api.get_sigmets(hazard)
     return sigmets
 
 @router.get("/taf/{station_id}")
 async def get_taf(station_id: str):
     station_id = station_id.upper()
 
-    taf = await AviationWeatherAPI().get_taf(station_id)
-    return taf
\ No newline at end of file
+    taf = await weather_api.get_taf(station_id)
+    return taf
+
+@router.get("/bundle/{station_id}")
+async def get_weather_bundle(station_id: str, hazard: str = None):
+    station_id = station_id.upper()
+
+    bundle = await weather_api.get_weather_bundle(station_id, hazard)
+    return bundle
+
+@router.get("/bundles")
+async def get_weather_bundles(ids: str):
+    # Comma-separated ICAO codes, e.g. ?ids=KJFK,KEWR,KLGA
+    station_ids = list(dict.fromkeys(s.strip().upper() for s in ids.split(",") if s.strip()))
+    if len(station_ids) > weather_api.MAX_BUNDLE_STATIONS:
+        # Each uncached TAF is its own upstream request, so keep one call bounded
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {weather_api.MAX_BUNDLE_STATIONS} stations per request"
+        )
+
+    bundles = await weather_api.get_weather_bundles(station_ids)
+    return bundles
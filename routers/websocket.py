@@ -0,0 +1,129 @@
+"""
+WebSocket router for pushing live updates to connected clients
+"""
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from typing import Dict, List
+import asyncio
+import logging
+import msgpack
+import orjson
+import redis.asyncio as redis
+from services.planes_service import PLANES_UPDATES_CHANNEL
+
+router = APIRouter(
+    tags=["websocket"]
+)
+
+logger = logging.getLogger(__name__)
+
+# Queued WebSocket messages are flushed to clients as one batch at this interval
+BROADCAST_FLUSH_INTERVAL = 0.075  # seconds
+
+
+class ConnectionManager:
+    def __init__(self):
+        # Each client gets a 1-slot queue drained by its own sender task, so a slow
+        # client only ever holds the newest frame and never delays the others
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self._senders: Dict[WebSocket, asyncio.Task] = {}
+        self._outbox: List[dict] = []
+    
+    async def connect(self, websocket: WebSocket):
+        await websocket.accept()
+        queue = asyncio.Queue(maxsize=1)
+        self.active_connections[websocket] = queue
+        self._senders[websocket] = asyncio.create_task(self._send_loop(websocket, queue))
+    
+    def disconnect(self, websocket: WebSocket):
+        self.active_connections.pop(websocket, None)
+        sender = self._senders.pop(websocket, None)
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
+    
+    async def _send_loop(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Send queued frames to one client until it disconnects"""
+        while True:
+            payload = await queue.get()
+            try:
+                await websocket.send_bytes(payload)
+            except Exception:
+                self.disconnect(websocket)
+                return
+    
+    async def broadcast(self, message: dict):
+        # Queue only; run_flusher() sends everything queued in a tick as one frame
+        self._outbox.append(message)
+    
+    async def flush(self):
+        """Hand all queued messages to every client as a single binary msgpack {"batch": [...]} frame"""
+        if not self._outbox:
+            return
+        messages, self._outbox = self._outbox, []
+        if not self.active_connections:
+            # Nobody to send to - drop the batch without packing it
+            return
+        
+        # Serialize once for all clients
+        payload = msgpack.packb({"batch": messages}, use_bin_type=True)
+        for queue in self.active_connections.values():
+            if queue.full():
+                # Client hasn't taken the previous frame yet - replace it with the newer one
+                queue.get_nowait()
+            queue.put_nowait(payload)
+    
+    async def run_flusher(self):
+        """Flush the outbox every BROADCAST_FLUSH_INTERVAL seconds until cancelled"""
+        while True:
+            await asyncio.sleep(BROADCAST_FLUSH_INTERVAL)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning("Error flushing WebSocket broadcasts: %s", e)
+
+
+# Singleton instance
+manager = ConnectionManager()
+
+
+async def relay_plane_updates():
+    """
+    Forward every planes blob the poller publishes to all WebSocket clients,
+    so clients get pushed updates instead of polling /api/planes.
+    One Redis subscription is shared by all connections.
+    """
+    redis_client = redis.Redis(host='localhost', port=6379)
+    try:
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(PLANES_UPDATES_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    if not manager.active_connections:
+                        # No clients connected - skip decoding this update
+                        continue
+                    # Decoded once here; flush() packs it once for every client
+                    await manager.broadcast({"type": "planes", "planes": orjson.loads(message["data"])})
+            except Exception as e:
+                logger.warning("Error relaying plane updates, resubscribing: %s", e)
+                await asyncio.sleep(5)
+            finally:
+                await pubsub.aclose()
+    finally:
+        await redis_client.aclose()
+
+
+@router.websocket("/ws")
+async def websocket_endpoint(websocket: WebSocket):
+    await manager.connect(websocket)
+    try:
+        # Drain whatever the client sends (text or binary) until it goes away
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    except WebSocketDisconnect:
+        pass
+    finally:
+        manager.disconnect(websocket)
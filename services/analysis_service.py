@@ -3,14 +3,19 @@ Analysis Service
 Analyzes aircraft data from Redis and weather data using Grok AI to generate tasks.
 Tasks are saved to tasks.json and retrieved via get_active_tasks().
 """
+import hashlib
 import json
 import os
-import redis
+import sys
+import orjson
+import redis.asyncio as redis
+import time
 import asyncio
 from pathlib import Path
-from typing import List, Dict, Optional
-from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timezone
 from dotenv import load_dotenv
+from pydantic import BaseModel, ConfigDict
 from dedalus_labs import AsyncDedalus, DedalusRunner
 
 # Load environment variables from .env file
@@ -24,21 +29,44 @@ DEDALUS_MODEL = os.getenv("DEDALUS_MODEL", "xai/grok-4-fast-non-reasoning")
 MCP_SERVERS = ["akakak/sonar"]  # Using playwright for web browsing/search
 
 TASKS_JSON_PATH = Path(__file__).parent / "tasks.json"
+# Serializes every load -> mutate -> save of tasks.json (analysis merges and task resolves)
+tasks_lock = asyncio.Lock()
 
 # Task expiration settings
 # Tasks that haven't been seen in this duration are considered stale and removed
 TASK_EXPIRY_MINUTES = int(os.getenv("TASK_EXPIRY_MINUTES", "10"))  # Default: 10 minutes
 # Resolved tasks older than this duration are pruned from the file
 RESOLVED_TASK_RETENTION_HOURS = int(os.getenv("RESOLVED_TASK_RETENTION_HOURS", "1"))  # Default: 1 hour
+# When an analysis cycle only refreshes last_seen, tasks.json is rewritten at most this often
+LAST_SEEN_PERSIST_INTERVAL_SECONDS = int(os.getenv("LAST_SEEN_PERSIST_INTERVAL_SECONDS", "60"))
 
 # Debug logging
 DEBUG_AGENT_STEPS = os.getenv("DEBUG_AGENT_STEPS", "true").lower() == "true"
 DEBUG_LOG_FILE = Path(__file__).parent / "agent_debug.log"
+# Dump each generated Grok context to example_context.txt (off by default - it's a disk write per cycle)
+DEBUG_CONTEXT_DUMP = os.getenv("DEBUG_CONTEXT_DUMP", "false").lower() == "true"
 
 # Audio storage
 AUDIO_DIR = Path(__file__).parent / "audio"
 AUDIO_DIR.mkdir(exist_ok=True)
 
+# Shared Redis connection pool so each analysis cycle reuses the same socket
+_REDIS = redis.Redis(host='localhost', port=6379, max_connections=8)
+
+
+class GrokTask(BaseModel):
+    """One task as returned by the LLM (schema defined in create_grok_prompt)"""
+    model_config = ConfigDict(extra='allow')
+    
+    aircraft_icao24: str = ''
+    aircraft_callsign: str = ''
+    priority: str = 'LOW'
+    category: str = 'Other'
+
+
+class GrokTasksResponse(BaseModel):
+    tasks: List[GrokTask] = []
+
 
 async def generate_audio_for_task(task_id: int, pilot_message: str) -> Optional[str]:
     """
@@ -61,14 +89,11 @@ async def generate_audio_for_task(task_id: int, pilot_message: str) -> Optional[
         filename = f"task_{task_id}.mp3"
         filepath = AUDIO_DIR / filename
         
-        # Generate audio
+        # Generate audio off the event loop (repeated messages come from the TTS cache)
         print(f"🔊 Generating audio for task {task_id}...")
-        audio_generator = tts_api.text_to_speech(pilot_message)
-        audio_data = b"".join(audio_generator)
+        audio = await tts_api.text_to_speech_async(pilot_message)
         
-        # Save to file
-        with open(filepath, 'wb') as f:
-            f.write(audio_data)
+        await asyncio.to_thread(filepath.write_bytes, audio)
         
         print(f"✓ Audio saved: {filename}")
         return filename
@@ -78,20 +103,38 @@ async def generate_audio_for_task(task_id: int, pilot_message: str) -> Optional[
         return None
 
 
-def get_redis_planes() -> List[Dict]:
+# Last parsed planes list and the planes:version stamp it was read at
+_planes_cache: List[Dict] = []
+_planes_cache_version: Optional[bytes] = None
+# Digest of the raw planes blob behind _planes_cache (lets run_analysis spot identical payloads)
+_planes_cache_digest: Optional[bytes] = None
+
+
+async def get_redis_planes() -> List[Dict]:
     """
     Get all aircraft data from Redis.
+    Checks the small planes:version key first and returns the previously parsed
+    list when the poller hasn't written anything new since the last call.
     
     Returns:
         List of aircraft dictionaries from Redis, or empty list if error
     """
-    r = redis.Redis(host='localhost', port=6379)
+    global _planes_cache, _planes_cache_version, _planes_cache_digest
+    
     try:
-        data = r.get('planes')
+        version = await _REDIS.get('planes:version')
+        if version is not None and version == _planes_cache_version:
+            return _planes_cache
+        
+        data = await _REDIS.get('planes')
         if not data:
             return []
-        planes = json.loads(data.decode('utf-8'))
-        return planes if isinstance(planes, list) else []
+        planes = orjson.loads(data)
+        planes = planes if isinstance(planes, list) else []
+        
+        _planes_cache, _planes_cache_version = planes, version
+        _planes_cache_digest = hashlib.blake2b(data, digest_size=16).digest()
+        return planes
     except Exception as e:
         print(f"Error reading planes from Redis: {e}")
         return []
@@ -115,8 +158,10 @@ async def get_weather_for_aircraft(lat: float, lon: float) -> Optional[Dict]:
         # Find nearest airport (simplified - you might want to improve this)
         # For now, we'll use a default airport or fetch METAR for nearest
         # This is a placeholder - you can enhance with nearest airport lookup
-        metar = await weather_api.get_metar("KATL")  # Default to Atlanta
-        return metar
+        station = "KATL"  # Default to Atlanta
+        
+        # weather_api caches METARs itself (CACHE_TTL_SECONDS["metar"])
+        return await weather_api.get_metar(station)
     except Exception as e:
         print(f"Error fetching weather: {e}")
         return None
@@ -133,8 +178,7 @@ def format_data_for_grok(planes: List[Dict], weather_data: Optional[Dict] = None
     Returns:
         Formatted string for Grok analysis
     """
-    context = "AIRCRAFT DATA:\n"
-    context += f"Total aircraft: {len(planes)}\n\n"
+    parts = ["AIRCRAFT DATA:\n", f"Total aircraft: {len(planes)}\n\n"]
     
     # Add aircraft details (limit to first 10 for context size)
     for i, plane in enumerate(planes[:10]):
@@ -143,46 +187,47 @@ def format_data_for_grok(planes: List[Dict], weather_data: Optional[Dict] = None
         registration = plane.get('r', '').strip() or None
         hex_code = plane.get('hex', '') or plane.get('icao', '')
         
-        context += f"Aircraft {i+1}:\n"
-        context += f"  Hex/ICAO24: {hex_code}\n"
-        context += f"  Callsign: {callsign or 'N/A'}\n"
-        context += f"  Registration: {registration or 'N/A'}\n"
-        context += f"  Type: {plane.get('t', 'UNKNOWN')}\n"
-        context += f"  Position: Lat {plane.get('lat', 'N/A')}, Lon {plane.get('lon', 'N/A')}\n"
-        context += f"  Altitude: {plane.get('alt_baro', 'N/A')}ft MSL\n"
-        context += f"  Groundspeed: {plane.get('gs', 'N/A')}kt\n"
-        context += f"  Vertical Rate: {plane.get('baro_rate', 'N/A')}ft/min\n"
-        context += f"  Heading: {plane.get('track', 'N/A')}°\n"
-        context += f"  Squawk: {plane.get('squawk', 'N/A')}\n\n"
+        parts.append(
+            f"Aircraft {i+1}:\n"
+            f"  Hex/ICAO24: {hex_code}\n"
+            f"  Callsign: {callsign or 'N/A'}\n"
+            f"  Registration: {registration or 'N/A'}\n"
+            f"  Type: {plane.get('t', 'UNKNOWN')}\n"
+            f"  Position: Lat {plane.get('lat', 'N/A')}, Lon {plane.get('lon', 'N/A')}\n"
+            f"  Altitude: {plane.get('alt_baro', 'N/A')}ft MSL\n"
+            f"  Groundspeed: {plane.get('gs', 'N/A')}kt\n"
+            f"  Vertical Rate: {plane.get('baro_rate', 'N/A')}ft/min\n"
+            f"  Heading: {plane.get('track', 'N/A')}°\n"
+            f"  Squawk: {plane.get('squawk', 'N/A')}\n\n"
+        )
     
     if weather_data:
-        context += "\nWEATHER DATA:\n"
-        context += f"Station: {weather_data.get('station', 'UNKNOWN')}\n"
-        context += f"Visibility: {weather_data.get('visibility', 'UNKNOWN')}sm\n"
-        context += f"Ceiling: {weather_data.get('ceiling', 'UNKNOWN')}ft AGL\n"
-        context += f"Flight Category: {weather_data.get('flight_category', 'UNKNOWN')}\n"
-        context += f"Wind: {weather_data.get('wind_direction', 'UNKNOWN')}° at {weather_data.get('wind_speed', 'UNKNOWN')}kt\n"
-        context += f"Temperature: {weather_data.get('temperature', 'UNKNOWN')}°C\n"
-        context += f"Conditions: {weather_data.get('conditions', 'UNKNOWN')}\n"
-    
-    with open("example_context.txt", "w") as f:
-        f.write(context)
+        parts.append(
+            "\nWEATHER DATA:\n"
+            f"Station: {weather_data.get('station', 'UNKNOWN')}\n"
+            f"Visibility: {weather_data.get('visibility', 'UNKNOWN')}sm\n"
+            f"Ceiling: {weather_data.get('ceiling', 'UNKNOWN')}ft AGL\n"
+            f"Flight Category: {weather_data.get('flight_category', 'UNKNOWN')}\n"
+            f"Wind: {weather_data.get('wind_direction', 'UNKNOWN')}° at {weather_data.get('wind_speed', 'UNKNOWN')}kt\n"
+            f"Temperature: {weather_data.get('temperature', 'UNKNOWN')}°C\n"
+            f"Conditions: {weather_data.get('conditions', 'UNKNOWN')}\n"
+        )
+    
+    context = "".join(parts)
+    
+    if DEBUG_CONTEXT_DUMP:
+        with open("example_context.txt", "w") as f:
+            f.write(context)
     return context
 
 
-def create_grok_prompt(context_data: str) -> str:
-    """
-    Create the analysis prompt for Dedalus AI with web search capabilities.
-    
-    Args:
-        context_data: Formatted aircraft and weather data
-    
-    Returns:
-        Complete prompt string
-    """
-    prompt = f"""You are an advanced FAA-compliant aviation safety AI assistant with web search capabilities, analyzing real-time flight data in United States airspace. Your job is to identify potential safety risks and generate actionable tasks for US air traffic controllers following FAA regulations and procedures.
+# Static parts of the analysis prompt, built once at import; create_grok_prompt
+# only splices the per-cycle context between them
+_PROMPT_HEAD = """You are an advanced FAA-compliant aviation safety AI assistant with web search capabilities, analyzing real-time flight data in United States airspace. Your job is to identify potential safety risks and generate actionable tasks for US air traffic controllers following FAA regulations and procedures.
+
+"""
 
-{context_data}
+_PROMPT_TAIL = """
 
 IMPORTANT: You have access to web search tools via MCP. Use them to research US-specific aviation data:
 1. Check FAA NOTAMs (Notices to Airmen) at https://notams.aim.faa.gov for active alerts
@@ -270,14 +315,113 @@ CRITICAL REQUIREMENTS:
 - Prioritize based on FAA safety risk: immediate safety-of-flight = HIGH, deviation from regs = MEDIUM, advisory = LOW
 - Only generate tasks for genuine regulatory violations or safety concerns per FAA standards
 
-If no risks are identified, return: {{"tasks": []}}
+If no risks are identified, return: {"tasks": []}
 
 Return ONLY valid JSON, no markdown, no code blocks, no explanations."""
+
+
+def create_grok_prompt(context_data: str) -> str:
+    """
+    Create the analysis prompt for Dedalus AI with web search capabilities.
+    
+    Args:
+        context_data: Formatted aircraft and weather data
     
-    return prompt
+    Returns:
+        Complete prompt string
+    """
+    return _PROMPT_HEAD + context_data + _PROMPT_TAIL
+
+
+def _append_debug_log(text: str):
+    """Append to the agent debug log (blocking; called via asyncio.to_thread)."""
+    with open(DEBUG_LOG_FILE, 'a') as f:
+        f.write(text)
+
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-run
+_background_tasks = set()
+
+
+async def _write_debug_log(debug_log: List[str], response):
+    """
+    Render the agent's intermediate steps, echo them to stdout and append them to
+    DEBUG_LOG_FILE. Runs as a background task so it doesn't hold up task processing.
+    
+    Args:
+        debug_log: Header lines already printed for this run
+        response: Dedalus runner response
+    """
+    header_len = len(debug_log)
+    debug_log.append(f"\n📊 Total Steps: {len(response.steps)}")
+    
+    for i, step in enumerate(response.steps, 1):
+        step_lines = [f"\n--- Step {i} ---"]
+        role = getattr(step, 'role', None)
+        tool_calls = getattr(step, 'tool_calls', None)
+        content = getattr(step, 'content', None)
+        tool_call_id = getattr(step, 'tool_call_id', None)
+        
+        # Log the step type and role
+        if role is not None:
+            step_lines.append(f"Role: {role}")
+        
+        # Log tool calls (web searches, etc.)
+        if tool_calls:
+            step_lines.append(f"🔧 Tool Calls: {len(tool_calls)}")
+            for j, tool_call in enumerate(tool_calls, 1):
+                step_lines.append(f"  Tool {j}:")
+                function = getattr(tool_call, 'function', None)
+                if function is not None:
+                    step_lines.append(f"    Function: {function.name}")
+                    arguments = getattr(function, 'arguments', None)
+                    if arguments is not None:
+                        # Parse arguments if they're JSON
+                        try:
+                            args = json.loads(arguments)
+                            step_lines.append(f"    Arguments: {json.dumps(args, indent=6)}")
+                        except:
+                            step_lines.append(f"    Arguments: {arguments[:200]}...")
+                else:
+                    name = getattr(tool_call, 'name', None)
+                    if name is not None:
+                        step_lines.append(f"    Name: {name}")
+        
+        # Log content/reasoning
+        if content:
+            content_str = str(content)
+            content_preview = content_str[:300]
+            step_lines.append(f"💭 Content: {content_preview}{'...' if len(content_str) > 300 else ''}")
+        
+        # Log tool responses
+        if tool_call_id is not None:
+            step_lines.append(f"🔄 Tool Response ID: {tool_call_id}")
+            if content is not None:
+                response_str = str(content)
+                response_preview = response_str[:200]
+                step_lines.append(f"   Response: {response_preview}{'...' if len(response_str) > 200 else ''}")
+        
+        debug_log.extend(step_lines)
+    
+    completion_msg = [
+        "\n" + "="*80,
+        "✅ DEDALUS AGENT COMPLETED",
+        "="*80 + "\n"
+    ]
+    debug_log.extend(completion_msg)
+    
+    # One stdout write for the whole block instead of a print per step
+    sys.stdout.write("\n".join(debug_log[header_len:]) + "\n")
+    
+    # Save to log file
+    try:
+        await asyncio.to_thread(_append_debug_log, "\n".join(debug_log) + "\n\n")
+        print(f"📝 Debug log saved to: {DEBUG_LOG_FILE}")
+    except Exception as e:
+        print(f"Warning: Could not save debug log: {e}")
 
 
-async def analyze_with_dedalus(planes: List[Dict], weather_data: Optional[Dict] = None) -> List[Dict]:
+async def analyze_with_dedalus(planes: List[Dict], weather_data: Optional[Dict] = None) -> Optional[List[Dict]]:
     """
     Analyze aircraft and weather data using Dedalus AI with web search capabilities.
     
@@ -286,16 +430,21 @@ async def analyze_with_dedalus(planes: List[Dict], weather_data: Optional[Dict]
         weather_data: Optional weather data dictionary
     
     Returns:
-        List of task dictionaries generated by Dedalus
+        List of task dictionaries generated by Dedalus, or None if the analysis failed
     """
     if not DEDALUS_API_KEY:
         print("Warning: DEDALUS_API_KEY not set. Skipping AI analysis.")
-        return []
+        return None
     
     # Format data for analysis
     context_data = format_data_for_grok(planes, weather_data)
     prompt = create_grok_prompt(context_data)
     
+    # One timestamp for the whole cycle (debug log + every task created below)
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
+    now_ts = now.timestamp()
+    
     try:
         # Initialize Dedalus client and runner
         client = AsyncDedalus(api_key=DEDALUS_API_KEY)
@@ -307,7 +456,7 @@ async def analyze_with_dedalus(planes: List[Dict], weather_data: Optional[Dict]
         if DEBUG_AGENT_STEPS:
             debug_log.append("\n" + "="*80)
             debug_log.append("🤖 DEDALUS AGENT EXECUTION - INTERMEDIATE STEPS")
-            debug_log.append(f"Timestamp: {datetime.now(timezone.utc).isoformat()}")
+            debug_log.append(f"Timestamp: {now_iso}")
             debug_log.append(f"Model: {DEDALUS_MODEL}")
             debug_log.append(f"MCP Servers: {MCP_SERVERS}")
             debug_log.append("="*80)
@@ -320,155 +469,95 @@ async def analyze_with_dedalus(planes: List[Dict], weather_data: Optional[Dict]
             mcp_servers=MCP_SERVERS  # playwright-mcp for web browsing/search
         )
         
-        # Log intermediate steps for debugging
+        # Log intermediate steps for debugging (rendered and written in the background)
         if DEBUG_AGENT_STEPS and hasattr(response, 'steps') and response.steps:
-            step_log = [f"\n📊 Total Steps: {len(response.steps)}"]
-            print(step_log[0])
-            
-            for i, step in enumerate(response.steps, 1):
-                step_lines = [f"\n--- Step {i} ---"]
-                
-                # Log the step type and role
-                if hasattr(step, 'role'):
-                    step_lines.append(f"Role: {step.role}")
-                
-                # Log tool calls (web searches, etc.)
-                if hasattr(step, 'tool_calls') and step.tool_calls:
-                    step_lines.append(f"🔧 Tool Calls: {len(step.tool_calls)}")
-                    for j, tool_call in enumerate(step.tool_calls, 1):
-                        step_lines.append(f"  Tool {j}:")
-                        if hasattr(tool_call, 'function'):
-                            step_lines.append(f"    Function: {tool_call.function.name}")
-                            if hasattr(tool_call.function, 'arguments'):
-                                # Parse arguments if they're JSON
-                                try:
-                                    args = json.loads(tool_call.function.arguments)
-                                    step_lines.append(f"    Arguments: {json.dumps(args, indent=6)}")
-                                except:
-                                    step_lines.append(f"    Arguments: {tool_call.function.arguments[:200]}...")
-                        elif hasattr(tool_call, 'name'):
-                            step_lines.append(f"    Name: {tool_call.name}")
-                
-                # Log content/reasoning
-                if hasattr(step, 'content') and step.content:
-                    content_str = str(step.content)
-                    content_preview = content_str[:300]
-                    step_lines.append(f"💭 Content: {content_preview}{'...' if len(content_str) > 300 else ''}")
-                
-                # Log tool responses
-                if hasattr(step, 'tool_call_id'):
-                    step_lines.append(f"🔄 Tool Response ID: {step.tool_call_id}")
-                    if hasattr(step, 'content'):
-                        response_str = str(step.content)
-                        response_preview = response_str[:200]
-                        step_lines.append(f"   Response: {response_preview}{'...' if len(response_str) > 200 else ''}")
-                
-                # Print and save to log
-                step_text = "\n".join(step_lines)
-                print(step_text)
-                debug_log.extend(step_lines)
-            
-            completion_msg = [
-                "\n" + "="*80,
-                "✅ DEDALUS AGENT COMPLETED",
-                "="*80 + "\n"
-            ]
-            print("\n".join(completion_msg))
-            debug_log.extend(completion_msg)
-            
-            # Save to log file
-            try:
-                with open(DEBUG_LOG_FILE, 'a') as f:
-                    f.write("\n".join(debug_log) + "\n\n")
-                print(f"📝 Debug log saved to: {DEBUG_LOG_FILE}")
-            except Exception as e:
-                print(f"Warning: Could not save debug log: {e}")
+            debug_task = asyncio.create_task(_write_debug_log(debug_log, response))
+            _background_tasks.add(debug_task)
+            debug_task.add_done_callback(_background_tasks.discard)
         
         # Extract the final output
         content = response.final_output
         
-        # Parse JSON response
-        parsed = json.loads(content)
-        tasks = parsed.get("tasks", [])
+        # Parse and validate the JSON response in a single pass
+        parsed_tasks = GrokTasksResponse.model_validate_json(content).tasks
+        tasks = []
         
         # Add metadata to each task and ensure proper identification
-        # Create a lookup map for hex codes by registration/callsign for fixing UNKNOWN values
-        plane_lookup = {}
+        # Index planes by callsign/registration -> hex and hex -> display name for fixing UNKNOWN values
+        by_callsign, by_registration, by_hex = {}, {}, {}
         for plane in planes:
-            hex_code = plane.get('hex', '')
-            callsign = plane.get('flight', '').strip()
-            registration = plane.get('r', '').strip()
-            if hex_code:
-                if callsign:
-                    plane_lookup[callsign] = {'hex': hex_code, 'registration': registration}
-                if registration:
-                    plane_lookup[registration] = {'hex': hex_code, 'callsign': callsign}
+            hex_code = plane.get('hex') or ''
+            if not hex_code:
+                continue
+            plane_callsign = (plane.get('flight') or '').strip()
+            registration = (plane.get('r') or '').strip()
+            by_hex[hex_code] = plane_callsign or registration
+            if plane_callsign:
+                by_callsign[plane_callsign] = hex_code
+            if registration:
+                by_registration[registration] = hex_code
         
-        for task in tasks:
+        for parsed_task in parsed_tasks:
             # Try to fix UNKNOWN aircraft_icao24 by looking up from planes data
-            icao24 = task.get('aircraft_icao24', '').strip()
-            callsign = task.get('aircraft_callsign', '').strip()
+            icao24 = parsed_task.aircraft_icao24.strip()
+            callsign = parsed_task.aircraft_callsign.strip()
             
             if not icao24 or icao24 == 'UNKNOWN':
-                # Try to find hex code using callsign
-                if callsign and callsign in plane_lookup:
-                    icao24 = plane_lookup[callsign]['hex']
-                else:
-                    icao24 = 'UNIDENTIFIED'
+                # Try to find hex code using callsign or registration
+                icao24 = by_callsign.get(callsign) or by_registration.get(callsign) or 'UNIDENTIFIED'
             
+            task = parsed_task.model_dump()
             task['aircraft_icao24'] = icao24
             
             # Ensure aircraft_callsign uses registration or ICAO24 as fallback
             if not callsign or callsign == 'UNKNOWN':
-                if icao24 in plane_lookup:
-                    callsign = plane_lookup[icao24].get('callsign') or plane_lookup[icao24].get('registration') or icao24
-                else:
-                    callsign = icao24
+                callsign = by_hex.get(icao24) or icao24
                 task['aircraft_callsign'] = callsign
             
             # Create a stable fingerprint for deduplication
             # Based on aircraft + category + priority (the core issue identifier)
-            fingerprint = f"{icao24}_{task.get('category', 'Other')}_{task.get('priority', 'LOW')}"
+            fingerprint = f"{icao24}_{parsed_task.category}_{parsed_task.priority}"
             task["fingerprint"] = fingerprint
-            task["id"] = abs(hash(fingerprint)) % 1000000  # Stable ID from fingerprint
-            task["created_at"] = datetime.now(timezone.utc).isoformat()
+            # blake2b is stable across processes (unlike hash()), so IDs survive restarts
+            task["id"] = int.from_bytes(hashlib.blake2b(fingerprint.encode(), digest_size=8).digest(), "big") % 1000000
+            task["created_at"] = now_iso
+            task["created_at_ts"] = now_ts
             task["resolved"] = False
             
             # Mark that audio is not yet generated
             task["audio_file"] = None
+            tasks.append(task)
         
         # Generate audio ONLY for the first 3 HIGH priority tasks
         # First, sort tasks by priority (HIGH first)
         high_priority_tasks = [t for t in tasks if t.get('priority', '').upper() == 'HIGH']
         
         # Count how many high priority tasks already have audio from existing tasks
-        existing_tasks = load_tasks()
-        existing_high_with_audio = sum(
-            1 for t in existing_tasks 
-            if not t.get("resolved", False) 
-            and t.get('priority', '').upper() == 'HIGH' 
-            and t.get('audio_file') is not None
-        )
+        existing_high_with_audio = count_high_priority_with_audio()
         
         # Calculate how many more audio files we can generate
         audio_slots_available = max(0, 3 - existing_high_with_audio)
         
         print(f"🎵 Audio generation: {existing_high_with_audio} high priority tasks with audio, {audio_slots_available} slots available")
         
-        # Generate audio for up to the available slots
+        # Generate audio for up to the available slots, all at once
+        audio_candidates = [t for t in high_priority_tasks if t.get('pilot_message')]
+        if len(audio_candidates) > audio_slots_available:
+            skipped = len(audio_candidates) - audio_slots_available
+            print(f"⏸️  Skipping audio for {skipped} task(s) - already have 3 high priority tasks with audio")
+        audio_candidates = audio_candidates[:audio_slots_available]
+        
+        audio_results = await asyncio.gather(
+            *(generate_audio_for_task(task["id"], task["pilot_message"]) for task in audio_candidates),
+            return_exceptions=True
+        )
+        
         audio_generated = 0
-        for task in high_priority_tasks:
-            if audio_generated >= audio_slots_available:
-                print(f"⏸️  Skipping audio for task {task['id']} - already have 3 high priority tasks with audio")
-                break
-            
-            pilot_message = task.get('pilot_message')
-            if pilot_message:
-                audio_filename = await generate_audio_for_task(task["id"], pilot_message)
-                if audio_filename:
-                    task["audio_file"] = audio_filename
-                    audio_generated += 1
-                    print(f"✓ Generated audio {audio_generated}/{audio_slots_available} for HIGH priority task {task['id']}")
+        for task, audio_filename in zip(audio_candidates, audio_results):
+            if isinstance(audio_filename, str):
+                task["audio_file"] = audio_filename
+                audio_generated += 1
+                print(f"✓ Generated audio {audio_generated}/{audio_slots_available} for HIGH priority task {task['id']}")
         
         print(f"Dedalus AI generated {len(tasks)} tasks ({audio_generated} with audio)")
         return tasks
@@ -477,7 +566,14 @@ async def analyze_with_dedalus(planes: List[Dict], weather_data: Optional[Dict]
         print(f"Error calling Dedalus API: {e}")
         import traceback
         traceback.print_exc()
-        return []
+        return None
+
+
+# Planes payload digest and time of the last analysis run (see run_analysis)
+_last_analyzed_digest: Optional[bytes] = None
+_last_analyzed_at = 0.0
+# Whether the current run of unchanged-data skips has already been reported
+_skip_reported = False
 
 
 async def run_analysis() -> List[Dict]:
@@ -492,13 +588,29 @@ async def run_analysis() -> List[Dict]:
     Returns:
         List of newly generated task dictionaries
     """
+    global _last_analyzed_digest, _last_analyzed_at, _skip_reported
+    
     # Get aircraft data from Redis
-    planes = get_redis_planes()
+    planes = await get_redis_planes()
     
     if not planes:
         print("⚠️ No aircraft data in Redis - skipping analysis")
         return []
     
+    # Identical aircraft payload as the last analysis -> the LLM would see the same input,
+    # so skip the round-trip. Re-run at least every half expiry window so tasks that are
+    # still relevant get their last_seen refreshed before they'd be pruned.
+    if (_planes_cache_digest == _last_analyzed_digest
+            and time.monotonic() - _last_analyzed_at < TASK_EXPIRY_MINUTES * 60 / 2):
+        if not _skip_reported:
+            print("⏭️  Aircraft data unchanged since last analysis - skipping until it changes")
+            _skip_reported = True
+        # Still prune so expired tasks aren't served while the analysis is skipped
+        await _merge_tasks([])
+        return []
+    _skip_reported = False
+    planes_digest = _planes_cache_digest
+    
     print(f"🔄 Running analysis on {len(planes)} aircraft...")
     # Get weather data (using first aircraft's position as reference)
     weather_data = None
@@ -510,55 +622,131 @@ async def run_analysis() -> List[Dict]:
     
     # Analyze with Dedalus (with web search capabilities)
     tasks = await analyze_with_dedalus(planes, weather_data)
+    if tasks is None:
+        # Failed analysis - still prune/save below, but leave the digest alone so the
+        # next cycle retries
+        tasks = []
+    else:
+        _last_analyzed_digest = planes_digest
+        _last_analyzed_at = time.monotonic()
+    
+    new_tasks, updated_count = await _merge_tasks(tasks)
+    
+    print(f"Analysis complete: {len(new_tasks)} new, {updated_count} updated")
+    return new_tasks
+
+
+async def _merge_tasks(tasks: List[Dict]) -> Tuple[List[Dict], int]:
+    """
+    Merge freshly generated tasks into tasks.json, prune outdated tasks and save.
+    
+    Args:
+        tasks: Tasks from the latest analysis (empty when the analysis was skipped or failed)
     
-    # Merge with existing tasks using fingerprint-based deduplication
-    existing_tasks = load_tasks()
+    Returns:
+        (newly added tasks, number of existing tasks that were updated)
+    """
+    global _last_seen_dirty
     
-    # Create a map of existing task fingerprints to indices (for unresolved tasks only)
-    existing_fingerprints = {}
-    for i, task in enumerate(existing_tasks):
-        if not task.get("resolved", False):
+    # Merge with existing tasks using fingerprint-based deduplication.
+    # Held under tasks_lock so a concurrent resolve can't interleave with the merge + save.
+    async with tasks_lock:
+        existing_tasks = load_tasks()
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
+        now_ts = now.timestamp()
+        
+        # Create a map of existing task fingerprints to indices (for unresolved tasks only)
+        existing_fingerprints = {}
+        for i, task in enumerate(existing_tasks):
+            if not task.get("resolved", False):
+                fingerprint = task.get("fingerprint")
+                if fingerprint:
+                    existing_fingerprints[fingerprint] = i
+        
+        new_tasks = []
+        updated_indices = set()
+        # Whether anything other than last_seen changed (new/updated/pruned tasks)
+        content_changed = False
+        
+        for task in tasks:
             fingerprint = task.get("fingerprint")
-            if fingerprint:
-                existing_fingerprints[fingerprint] = i
+            if fingerprint and fingerprint in existing_fingerprints:
+                # Task already exists - update its timestamp to show it's still active
+                idx = existing_fingerprints[fingerprint]
+                existing_tasks[idx]["last_seen"] = now_iso
+                existing_tasks[idx]["last_seen_ts"] = now_ts
+                # Update description if it's more detailed
+                if len(task.get("description", "")) > len(existing_tasks[idx].get("description", "")):
+                    existing_tasks[idx]["description"] = task["description"]
+                    content_changed = True
+                # Preserve existing audio file if it exists, otherwise use new one
+                if not existing_tasks[idx].get("audio_file") and task.get("audio_file"):
+                    existing_tasks[idx]["audio_file"] = task["audio_file"]
+                    content_changed = True
+                updated_indices.add(idx)
+            else:
+                # New task - add it
+                task["last_seen"] = task["created_at"]
+                task["last_seen_ts"] = task["created_at_ts"]
+                new_tasks.append(task)
+        
+        # Combine all tasks: existing (with updates) + new
+        all_tasks = existing_tasks + new_tasks
+        
+        # Clean up outdated tasks
+        combined_count = len(all_tasks)
+        all_tasks, active_tasks, high_with_audio = _scan_tasks(all_tasks)
+        content_changed = content_changed or bool(new_tasks) or len(all_tasks) != combined_count
+        
+        # Save to tasks.json without blocking the event loop. If only last_seen moved, the
+        # in-memory tasks are already up to date, so the write can wait a while; with
+        # nothing changed at all (e.g. a skipped cycle) there is nothing to write.
+        if updated_indices:
+            _last_seen_dirty = True
+        if content_changed or (_last_seen_dirty and time.monotonic() - _tasks_saved_at >= LAST_SEEN_PERSIST_INTERVAL_SECONDS):
+            await asyncio.to_thread(save_tasks, all_tasks, (active_tasks, high_with_audio))
     
-    new_tasks = []
-    updated_indices = set()
+    return new_tasks, len(updated_indices)
+
+
+def _task_timestamp(task: Dict, key: str) -> Optional[float]:
+    """
+    Get a task timestamp as epoch seconds.
+    Uses the cached "<key>_ts" value when present and only falls back to parsing
+    the ISO string for tasks written before the _ts fields existed.
     
-    for task in tasks:
-        fingerprint = task.get("fingerprint")
-        if fingerprint and fingerprint in existing_fingerprints:
-            # Task already exists - update its timestamp to show it's still active
-            idx = existing_fingerprints[fingerprint]
-            existing_tasks[idx]["last_seen"] = datetime.now(timezone.utc).isoformat()
-            # Update description if it's more detailed
-            if len(task.get("description", "")) > len(existing_tasks[idx].get("description", "")):
-                existing_tasks[idx]["description"] = task["description"]
-            # Preserve existing audio file if it exists, otherwise use new one
-            if not existing_tasks[idx].get("audio_file") and task.get("audio_file"):
-                existing_tasks[idx]["audio_file"] = task["audio_file"]
-            updated_indices.add(idx)
-        else:
-            # New task - add it
-            task["last_seen"] = task["created_at"]
-            new_tasks.append(task)
-    
-    # Combine all tasks: existing (with updates) + new
-    all_tasks = existing_tasks + new_tasks
-    
-    # Clean up outdated tasks
-    all_tasks = prune_outdated_tasks(all_tasks)
-    
-    # Save to tasks.json
-    save_tasks(all_tasks)
-    
-    print(f"Analysis complete: {len(new_tasks)} new, {len(updated_indices)} updated")
-    return new_tasks
+    Args:
+        task: Task dictionary
+        key: Timestamp field name ("created_at" or "last_seen")
+        
+    Returns:
+        Epoch seconds, or None if the task has no such timestamp
+    """
+    ts = task.get(f"{key}_ts")
+    if ts is not None:
+        return ts
+    
+    iso_str = task.get(key)
+    if not iso_str:
+        return None
+    parsed = datetime.fromisoformat(iso_str.replace('Z', '+00:00'))
+    # Make timezone-aware if naive
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    ts = parsed.timestamp()
+    task[f"{key}_ts"] = ts
+    return ts
 
 
-def prune_outdated_tasks(tasks: List[Dict]) -> List[Dict]:
+def _is_high_with_audio(task: Dict) -> bool:
+    """Whether an active task counts against the 3 HIGH-priority audio slots."""
+    return task.get('priority', '').upper() == 'HIGH' and task.get('audio_file') is not None
+
+
+def _scan_tasks(tasks: List[Dict]) -> Tuple[List[Dict], List[Dict], int]:
     """
-    Remove outdated tasks from the task list.
+    Prune outdated tasks and build the active view in a single pass.
     
     Pruning rules:
     1. Unresolved tasks: Remove if last_seen is older than TASK_EXPIRY_MINUTES
@@ -568,76 +756,93 @@ def prune_outdated_tasks(tasks: List[Dict]) -> List[Dict]:
         tasks: List of task dictionaries
         
     Returns:
-        List of tasks with outdated tasks removed
+        (kept tasks, active (unresolved) kept tasks, number of active HIGH priority tasks with audio)
     """
-    now = datetime.now(timezone.utc)
-    task_expiry_cutoff = now - timedelta(minutes=TASK_EXPIRY_MINUTES)
-    resolved_retention_cutoff = now - timedelta(hours=RESOLVED_TASK_RETENTION_HOURS)
+    now_ts = datetime.now(timezone.utc).timestamp()
+    task_expiry_cutoff = now_ts - TASK_EXPIRY_MINUTES * 60
+    resolved_retention_cutoff = now_ts - RESOLVED_TASK_RETENTION_HOURS * 3600
     
     pruned_tasks = []
+    active_tasks = []
+    high_with_audio = 0
     removed_count = 0
     
     for task in tasks:
+        is_resolved = task.get("resolved", False)
         try:
-            is_resolved = task.get("resolved", False)
-            
             if not is_resolved:
                 # For unresolved tasks, check last_seen timestamp
-                last_seen_str = task.get("last_seen") or task.get("created_at")
-                if last_seen_str:
-                    # Handle both formats: with and without timezone info
-                    last_seen = datetime.fromisoformat(last_seen_str.replace('Z', '+00:00'))
-                    # Make timezone-aware if naive
-                    if last_seen.tzinfo is None:
-                        last_seen = last_seen.replace(tzinfo=timezone.utc)
-                    
-                    if last_seen < task_expiry_cutoff:
-                        # Task is stale - hasn't been seen recently
-                        removed_count += 1
-                        print(f"  Pruned stale task: {task.get('aircraft_callsign', 'UNKNOWN')} - {task.get('category', 'UNKNOWN')} (last seen: {last_seen_str})")
-                        continue
+                last_seen = _task_timestamp(task, "last_seen") or _task_timestamp(task, "created_at")
+                if last_seen is not None and last_seen < task_expiry_cutoff:
+                    # Task is stale - hasn't been seen recently
+                    removed_count += 1
+                    print(f"  Pruned stale task: {task.get('aircraft_callsign', 'UNKNOWN')} - {task.get('category', 'UNKNOWN')} (last seen: {task.get('last_seen') or task.get('created_at')})")
+                    continue
             else:
                 # For resolved tasks, check created_at timestamp
-                created_at_str = task.get("created_at")
-                if created_at_str:
-                    created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
-                    if created_at.tzinfo is None:
-                        created_at = created_at.replace(tzinfo=timezone.utc)
-                    
-                    if created_at < resolved_retention_cutoff:
-                        # Resolved task is too old - prune it
-                        removed_count += 1
-                        continue
-            
-            # Task is still valid - keep it
-            pruned_tasks.append(task)
-            
+                created_at = _task_timestamp(task, "created_at")
+                if created_at is not None and created_at < resolved_retention_cutoff:
+                    # Resolved task is too old - prune it
+                    removed_count += 1
+                    continue
         except Exception as e:
             # If there's an error parsing timestamps, keep the task to be safe
             print(f"  Warning: Could not parse timestamp for task {task.get('id')}: {e}")
-            pruned_tasks.append(task)
+        
+        # Task is still valid - keep it
+        pruned_tasks.append(task)
+        if not is_resolved:
+            active_tasks.append(task)
+            if _is_high_with_audio(task):
+                high_with_audio += 1
     
     if removed_count > 0:
         print(f"  Pruned {removed_count} outdated task(s)")
     
-    return pruned_tasks
+    return pruned_tasks, active_tasks, high_with_audio
 
 
-def save_tasks(tasks: List[Dict]):
+def save_tasks(tasks: List[Dict], active_view: Optional[Tuple[List[Dict], int]] = None):
     """
     Save tasks to tasks.json file.
+    Writes to a temp file and renames it so readers never see a partial file.
     
     Args:
         tasks: List of task dictionaries
+        active_view: Optional (active tasks, HIGH-with-audio count) from _scan_tasks,
+            used to seed the get_active_tasks() cache instead of rebuilding it
     """
+    global _tasks_cache, _tasks_cache_mtime, _active_tasks_cache, _active_tasks_mtime, _high_with_audio_count, _tasks_saved_at, _last_seen_dirty
+    
     try:
-        with open(TASKS_JSON_PATH, 'w') as f:
-            json.dump(tasks, f, indent=2)
+        tmp_path = TASKS_JSON_PATH.with_suffix('.json.tmp')
+        tmp_path.write_bytes(orjson.dumps(tasks))
+        os.replace(tmp_path, TASKS_JSON_PATH)
+        
+        # Seed the cache with what we just wrote so the next load skips the re-read
+        _tasks_cache = tasks
+        _tasks_cache_mtime = TASKS_JSON_PATH.stat().st_mtime_ns
+        _tasks_saved_at = time.monotonic()
+        _last_seen_dirty = False
+        if active_view is not None:
+            _active_tasks_cache, _high_with_audio_count = active_view
+            _active_tasks_mtime = _tasks_cache_mtime
         print(f"Saved {len(tasks)} tasks to {TASKS_JSON_PATH}")
     except Exception as e:
         print(f"Error saving tasks to JSON: {e}")
 
 
+# Parsed tasks.json, reused until the file changes on disk. Callers that mutate
+# tasks in place (e.g. resolve_task) share this list, so every reader sees the
+# change even before it has been written back.
+_tasks_cache: Optional[List[Dict]] = None
+_tasks_cache_mtime: Optional[int] = None
+# time.monotonic() of the last successful save_tasks()
+_tasks_saved_at = float("-inf")
+# Whether in-memory last_seen updates haven't been written to tasks.json yet
+_last_seen_dirty = False
+
+
 def load_tasks() -> List[Dict]:
     """
     Load tasks from tasks.json file.
@@ -645,25 +850,81 @@ def load_tasks() -> List[Dict]:
     Returns:
         List of task dictionaries, or empty list if file doesn't exist
     """
+    global _tasks_cache, _tasks_cache_mtime
+    
     try:
-        if not TASKS_JSON_PATH.exists():
+        try:
+            mtime = TASKS_JSON_PATH.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
         
-        with open(TASKS_JSON_PATH, 'r') as f:
-            tasks = json.load(f)
-            return tasks if isinstance(tasks, list) else []
+        if _tasks_cache is not None and mtime == _tasks_cache_mtime:
+            return _tasks_cache
+        
+        tasks = orjson.loads(TASKS_JSON_PATH.read_bytes())
+        _tasks_cache = tasks if isinstance(tasks, list) else []
+        _tasks_cache_mtime = mtime
+        return _tasks_cache
     except Exception as e:
         print(f"Error loading tasks from JSON: {e}")
         return []
 
 
+# Cached active-task view, reloaded only when tasks.json changes on disk
+_active_tasks_cache: Optional[List[Dict]] = None
+_active_tasks_mtime: Optional[int] = None
+_high_with_audio_count = 0
+
+
+def invalidate_active_tasks():
+    """
+    Drop the cached active-task view so the next get_active_tasks() reloads it.
+    Call this after mutating tasks in place (e.g. resolving a task).
+    """
+    global _active_tasks_cache, _active_tasks_mtime
+    _active_tasks_cache = None
+    _active_tasks_mtime = None
+
+
 def get_active_tasks() -> List[Dict]:
     """
     Get only active (unresolved) tasks.
     This is called by the tasks.py endpoint when the frontend requests tasks.
+    The filtered list is cached and only rebuilt when tasks.json's mtime changes.
     
     Returns:
         List of unresolved task dictionaries
     """
-    all_tasks = load_tasks()
-    return [task for task in all_tasks if not task.get('resolved', False)]
+    global _active_tasks_cache, _active_tasks_mtime, _high_with_audio_count
+    
+    try:
+        mtime = TASKS_JSON_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    
+    if _active_tasks_cache is not None and mtime == _active_tasks_mtime:
+        return _active_tasks_cache
+    
+    active_tasks = []
+    high_with_audio = 0
+    for task in load_tasks():
+        if not task.get('resolved', False):
+            active_tasks.append(task)
+            if _is_high_with_audio(task):
+                high_with_audio += 1
+    _active_tasks_cache = active_tasks
+    _high_with_audio_count = high_with_audio
+    _active_tasks_mtime = mtime
+    return _active_tasks_cache
+
+
+def count_high_priority_with_audio() -> int:
+    """
+    Number of active HIGH priority tasks that already have audio.
+    Maintained alongside the cached active view, so this doesn't rescan tasks.json.
+    
+    Returns:
+        Count of active HIGH priority tasks with an audio file
+    """
+    # No active tasks (e.g. tasks.json missing) means nothing holds an audio slot
+    return _high_with_audio_count if get_active_tasks() else 0
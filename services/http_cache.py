@@ -0,0 +1,30 @@
+"""
+HTTP caching helpers shared by the API endpoints
+"""
+import hashlib
+from fastapi import Request
+from fastapi.responses import Response
+
+
+def etag_json_response(request: Request, body: bytes) -> Response:
+    """
+    Return an already-serialized JSON body tagged with a content-hash ETag.
+    Replies 304 Not Modified when the client's If-None-Match matches.
+    
+    Args:
+        request: Incoming request (for the If-None-Match header)
+        body: JSON-encoded response body
+    
+    Returns:
+        200 response with the body, or an empty 304 response
+    """
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    # no-cache: the browser may keep the body but must revalidate every time, so a
+    # refetch right after a change (e.g. resolving a task) never gets a stale copy;
+    # unchanged data still costs only a 304
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
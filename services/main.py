@@ -3,7 +3,7 @@ FastAPI application entry point
 
 Run with:
     cd /Users/sainallani/Projects/hack-princeton-1
-    PYTHONPATH=. uvicorn services.main:app --host 0.0.0.0 --port 8000 --reload
+    PYTHONPATH=. uvicorn services.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --reload
 """
 import sys
 from pathlib import Path
@@ -13,54 +13,30 @@ project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-import sys
-from pathlib import Path
-
-# Add project root to Python path so we can import routers
-project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager
+import aiohttp
 import asyncio
-import json
-import redis
-import requests
+import logging
+import os
 from routers.weather import router as weather_router
-from routers.tasks import router as tasks_router
+from routers.tasks import router as tasks_router, persist_resolved_tasks
 from routers.tts import router as tts_router
+from routers.websocket import router as websocket_router, manager, relay_plane_updates
 from services.analysis_service import run_analysis
+from services.planes_service import planes_service
+from services.weather_api import weather_api
+from services.http_cache import etag_json_response
 
-TARGET_LAT = 33.6410564
-TARGET_LON = -84.4421781
-MAX_DISTANCE_NM = 40  # nautical miles
+# Level-gated logging; set LOG_LEVEL=DEBUG to see per-request messages
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
 
 # Background analysis state
 analysis_lock = asyncio.Lock()
 analysis_running = False
 
-async def poll_opensky():
-    """
-    Poll airplanes.live API every 3 seconds and cache filtered planes in Redis
-    """
-    r = redis.Redis(host='localhost', port=6379)
-    while True:
-        try:
-            response = requests.get(f"https://api.airplanes.live/v2/point/{TARGET_LAT}/{TARGET_LON}/{MAX_DISTANCE_NM}")
-            planes = response.json().get('ac', [])
-
-            # Cache in Redis
-            r.set('planes', json.dumps(planes), ex=600)  # 10 minutes
-            print(f"Cached {len(planes)} planes within {MAX_DISTANCE_NM} nm")
-
-        except Exception as e:
-            print(f"Error polling airplanes.live API: {e}")
-
-        await asyncio.sleep(1)
-
-
 async def continuous_analysis():
     """
     Continuously run analysis in the background for instant API responses.
@@ -90,10 +66,42 @@ async def continuous_analysis():
             await asyncio.sleep(5)  # Wait longer on error
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open shared resources and start background loops on startup, clean up on shutdown
+    """
+    # One pooled HTTP session for upstream APIs, kept alive for the life of the process
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=10)
+    )
+    planes_service.start_polling(app.state.http)
+    background_tasks = [
+        asyncio.create_task(continuous_analysis()),
+        asyncio.create_task(manager.run_flusher()),
+        asyncio.create_task(relay_plane_updates()),
+        asyncio.create_task(persist_resolved_tasks()),
+        asyncio.create_task(weather_api.warmup()),
+    ]
+    
+    yield
+    
+    for task in background_tasks:
+        task.cancel()
+    # Let cancelled loops finish their cleanup (e.g. flushing pending task writes)
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await planes_service.close()
+    await weather_api.close()
+    await app.state.http.close()
+
+
 app = FastAPI(
     title="AirGuardian API",
     description="API for monitoring aircraft and weather conditions",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson instead of stdlib json for every route
 )
 
 # CORS middleware - very permissive for development
@@ -109,59 +117,23 @@ app.add_middleware(
 app.include_router(weather_router)
 app.include_router(tasks_router)
 app.include_router(tts_router)
-
-class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
-    
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
-    
-    def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-    
-    async def broadcast(self, message: dict):
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except:
-                pass
-
-manager = ConnectionManager()
-
-@app.on_event("startup")
-async def startup_event():
-    asyncio.create_task(poll_opensky())
-    asyncio.create_task(continuous_analysis())
+app.include_router(websocket_router)
 
 @app.get("/api/planes")
-async def get_planes():
+async def get_planes(request: Request):
     """
-    Return all plane data from Redis cache as returned by airplanes.live API
+    Return all plane data from Redis cache as returned by airplanes.live API.
+    The cached blob is already JSON, so it is sent as-is with an ETag.
     """
-    r = redis.Redis(host='localhost', port=6379)
-    data = r.get("planes")
-    if data:
-        planes = json.loads(data.decode("utf-8"))
-        # Return all data as-is from the airplanes.live API
-        return planes
-    return []
+    data = await planes_service.get_planes_json()
+    # Return all data as-is from the airplanes.live API
+    return etag_json_response(request, data)
 
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
 
-@app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
-    await manager.connect(websocket)
-    try:
-        while True:
-            data = await websocket.receive_json()
-            print(f"Received: {data}")
-    except WebSocketDisconnect:
-        manager.disconnect(websocket)
-
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools ship with uvicorn[standard]; pin them rather than relying on "auto"
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
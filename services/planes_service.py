@@ -1,13 +1,26 @@
 """
 Service for managing airplane data polling and caching
 """
+import aiohttp
 import asyncio
-import json
-import redis
-import requests
+import logging
+import orjson
+import redis.asyncio as redis
+import time
 from typing import Optional, List, Dict
 
 
+logger = logging.getLogger(__name__)
+
+# Redis pub/sub channel that carries each freshly polled planes blob
+PLANES_UPDATES_CHANNEL = 'planes:updates'
+
+# While airplanes.live keeps returning the same aircraft, the poll interval doubles up to this cap
+MAX_POLL_INTERVAL_SECONDS = 8
+# Unchanged data is still rewritten this often so the 10 minute Redis TTL never lapses
+REDIS_REFRESH_SECONDS = 60
+
+
 class PlanesService:
     """Service for polling and caching airplane data from airplanes.live API"""
     
@@ -22,33 +35,101 @@ class PlanesService:
         self.target_lon = target_lon
         self.max_distance_nm = max_distance_nm
         self.poll_interval = poll_interval
-        self.redis_client = redis.Redis()
+        self.redis_client = redis.Redis(host='localhost', port=6379, max_connections=32)
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._owns_http = False
         self._polling_task: Optional[asyncio.Task] = None
+        # Last poll result kept in-process so reads skip the Redis round-trip + parse;
+        # Redis stays the source of truth for other processes / a stalled poller
+        self._cache: List[Dict] = []
+        self._cache_json: bytes = b"[]"
+        self._cache_ts: float = float("-inf")
+        # Conditional-GET / change-detection state; the interval backs off while data is unchanged
+        self._last_etag: Optional[str] = None
+        self._current_interval: float = poll_interval
+        self._last_write_ts: float = float("-inf")
     
     async def poll_opensky(self):
         """
         Poll airplanes.live API and cache filtered planes in Redis
         Runs continuously until stopped
         """
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5))
+            self._owns_http = True
+        
+        url = (
+            f"https://api.airplanes.live/v2/point/"
+            f"{self.target_lat}/{self.target_lon}/{self.max_distance_nm}"
+        )
+        # Polls are scheduled against fixed deadlines so request latency doesn't stretch the cadence
+        next_deadline = time.monotonic()
         while True:
             try:
-                response = requests.get(
-                    f"https://api.airplanes.live/v2/point/"
-                    f"{self.target_lat}/{self.target_lon}/{self.max_distance_nm}"
-                )
-                planes = response.json().get('ac', [])
+                headers = {"Accept-Encoding": "gzip"}
+                if self._last_etag:
+                    headers["If-None-Match"] = self._last_etag
+                async with self._http.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        body = None
+                    else:
+                        self._last_etag = response.headers.get("ETag")
+                        body = await response.read()
                 
-                # Cache in Redis
-                self.redis_client.set('planes', json.dumps(planes))
-                print(f"Cached {len(planes)} planes within {self.max_distance_nm} nm")
+                payload = None
+                if body is not None:
+                    planes = orjson.loads(body).get('ac', [])
+                    payload = orjson.dumps(planes)
+                
+                now = time.monotonic()
+                if payload is None or payload == self._cache_json:
+                    # Nothing changed: keep serving the current copy and poll less often
+                    self._cache_ts = now
+                    self._current_interval = min(self._current_interval * 2, MAX_POLL_INTERVAL_SECONDS)
+                    if now - self._last_write_ts >= REDIS_REFRESH_SECONDS:
+                        # Rewrite just often enough to keep the keys from expiring (no new version/publish)
+                        async with self.redis_client.pipeline(transaction=False) as pipe:
+                            pipe.set('planes', self._cache_json, ex=600)
+                            pipe.expire('planes:version', 600)
+                            await pipe.execute()
+                        self._last_write_ts = now
+                else:
+                    self._cache, self._cache_json, self._cache_ts = planes, payload, now
+                    self._current_interval = self.poll_interval
+                    
+                    # Cache in Redis, plus a version stamp so readers can skip unchanged data,
+                    # and publish it, all in a single pipelined round-trip
+                    async with self.redis_client.pipeline(transaction=False) as pipe:
+                        pipe.set('planes', payload, ex=600)  # 10 minutes
+                        pipe.set('planes:version', time.time_ns(), ex=600)
+                        # Push the fresh blob to WebSocket relays (see routers/websocket.py)
+                        pipe.publish(PLANES_UPDATES_CHANNEL, payload)
+                        await pipe.execute()
+                    self._last_write_ts = now
+                    logger.debug("Cached %d planes within %d nm", len(planes), self.max_distance_nm)
                 
             except Exception as e:
-                print(f"Error polling airplanes.live API: {e}")
+                logger.warning("Error polling airplanes.live API: %s", e)
             
-            await asyncio.sleep(self.poll_interval)
+            next_deadline += self._current_interval
+            delay = next_deadline - time.monotonic()
+            if delay < 0:
+                # Fell behind (slow API) - poll again right away instead of bursting to catch up
+                logger.debug("Planes poll overran its interval by %.2fs", -delay)
+                next_deadline = time.monotonic()
+            await asyncio.sleep(max(0.0, delay))
     
-    def start_polling(self):
-        """Start the background polling task"""
+    def start_polling(self, http: Optional[aiohttp.ClientSession] = None):
+        """
+        Start the background polling task
+        
+        Args:
+            http: Optional shared session to poll with (the caller keeps ownership);
+                  a private session is created when omitted
+        """
+        if http is not None:
+            self._http = http
+            self._owns_http = False
         if self._polling_task is None or self._polling_task.done():
             self._polling_task = asyncio.create_task(self.poll_opensky())
             return self._polling_task
@@ -59,20 +140,47 @@ class PlanesService:
         if self._polling_task and not self._polling_task.done():
             self._polling_task.cancel()
     
-    def get_planes(self) -> List[Dict]:
+    async def close(self):
+        """Stop polling and close the HTTP session and Redis pool (call on app shutdown)"""
+        self.stop_polling()
+        if self._polling_task is not None:
+            await asyncio.gather(self._polling_task, return_exceptions=True)
+        if self._owns_http and self._http is not None and not self._http.closed:
+            await self._http.close()
+        await self.redis_client.aclose()
+    
+    def _cache_fresh(self) -> bool:
+        """Whether the in-process copy is from a recent poll"""
+        return time.monotonic() - self._cache_ts < self._current_interval * 2
+    
+    async def get_planes_json(self) -> bytes:
+        """
+        Get the cached plane data as the raw JSON bytes stored in Redis
+        
+        Returns:
+            JSON array of plane dictionaries from airplanes.live API
+        """
+        if self._cache_fresh():
+            return self._cache_json
+        return await self.redis_client.get("planes") or b"[]"
+    
+    async def get_planes(self) -> List[Dict]:
         """
         Get all plane data from Redis cache
         
         Returns:
             List of plane dictionaries from airplanes.live API
         """
-        data = self.redis_client.get("planes")
+        if self._cache_fresh():
+            return self._cache
+        
+        data = await self.redis_client.get("planes")
         if data:
             try:
-                planes = json.loads(data.decode("utf-8"))
+                planes = orjson.loads(data)
                 return planes
-            except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                print(f"Error decoding planes data: {e}")
+            except orjson.JSONDecodeError as e:
+                logger.warning("Error decoding planes data: %s", e)
                 return []
         return []
 
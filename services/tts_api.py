@@ -1,10 +1,15 @@
 import os
+import asyncio
+from collections import OrderedDict
 from dotenv import load_dotenv
 from elevenlabs import ElevenLabs
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Most recent synthesized clips kept in memory (ElevenLabs bills per character, so repeats are free)
+TTS_LRU_MAX_ENTRIES = 64
+
 class TTSAPI:
     def __init__(self):
         self.api_key = os.getenv("ELEVENLABS_API_KEY")
@@ -20,6 +25,8 @@ class TTSAPI:
         self.default_voice_id = "JBFqnCBsd6RMkjVDRZzb"
         self.default_model_id = "eleven_multilingual_v2"
         self.default_output_format = "mp3_44100_128"
+        # (text, voice_id, model_id, output_format) -> MP3 bytes, least recently used first
+        self._cache: "OrderedDict[tuple, bytes]" = OrderedDict()
     
     def text_to_speech(self, text: str, voice_id: str = None, model_id: str = None, output_format: str = None):
         if not self.client:
@@ -30,5 +37,43 @@ class TTSAPI:
             text=text,
             model_id=model_id or self.default_model_id
         )
+    
+    def text_to_speech_stream(self, text: str, voice_id: str = None, model_id: str = None, output_format: str = None):
+        """
+        Like text_to_speech, but uses the streaming endpoint so audio chunks arrive
+        while the rest is still being generated (lower time-to-first-byte).
+        Returns a blocking iterator of audio byte chunks.
+        """
+        if not self.client:
+            raise ValueError("ElevenLabs client not initialized - API key missing")
+        return self.client.text_to_speech.stream(
+            voice_id=voice_id or self.default_voice_id,
+            output_format=output_format or self.default_output_format,
+            text=text,
+            model_id=model_id or self.default_model_id
+        )
+    
+    async def text_to_speech_async(self, text: str, voice_id: str = None, model_id: str = None, output_format: str = None) -> bytes:
+        """
+        Synthesize text to complete audio bytes without blocking the event loop.
+        Results are kept in a small LRU cache, so repeated text isn't re-synthesized.
+        """
+        voice_id = voice_id or self.default_voice_id
+        model_id = model_id or self.default_model_id
+        output_format = output_format or self.default_output_format
+        key = (text, voice_id, model_id, output_format)
+        
+        audio = self._cache.get(key)
+        if audio is not None:
+            self._cache.move_to_end(key)
+            return audio
+        
+        audio = await asyncio.to_thread(
+            lambda: b"".join(self.text_to_speech(text, voice_id, model_id, output_format))
+        )
+        self._cache[key] = audio
+        if len(self._cache) > TTS_LRU_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+        return audio
 
 tts_api = TTSAPI()
\ No newline at end of file
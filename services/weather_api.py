@@ -1,10 +1,27 @@
 import aiohttp
+import asyncio
+import calendar
 import ssl
 import re
+import time
+import orjson
+from functools import lru_cache
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 from metar_taf_parser.parser.parser import TAFParser
-import pandas as pd
+import numpy as np
+
+# METAR/visibility token patterns, compiled once at import
+# Wind: 3-digit direction (or VRB), 2-3 digit speed, optional G (gusts), KT
+# Examples: "12015KT", "VRB05KT", "00000KT", "12015G25KT"
+_WIND_RE = re.compile(r'\b(\d{3}|VRB)(\d{2,3})(?:G(\d{2,3}))?KT\b')
+_P_SM_RE = re.compile(r'P(\d+)SM')
+_FRACTION_RE = re.compile(r'(\d+)?\s*(\d+)/(\d+)')
+
+# SSL context that doesn't verify certificates, built once and shared by every client
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.check_hostname = False
+_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
 
 class AviationWeatherAPI:
     """
@@ -13,13 +30,23 @@ class AviationWeatherAPI:
     """
     
     BASE_URL = "https://aviationweather.gov/api/data"
+    # Successful responses are reused for this long, per product, matching how often each
+    # is issued (METARs ~hourly plus specials, TAFs every 6h plus amendments, SIGMETs ~15 min)
+    CACHE_TTL_SECONDS = {
+        "metar": 300,
+        "taf": 1800,
+        "sigmet": 300,
+    }
+    # Most stations a single bulk request (get_weather_bundles) may ask for
+    MAX_BUNDLE_STATIONS = 20
+    # Expired entries are swept from the cache once it holds more than this many
+    CACHE_SWEEP_THRESHOLD = 256
     
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
-        # Create SSL context that doesn't verify certificates
-        self.ssl_context = ssl.create_default_context()
-        self.ssl_context.check_hostname = False
-        self.ssl_context.verify_mode = ssl.CERT_NONE
+        # (product, *params) -> (fetched_at monotonic, parsed result)
+        self._cache: Dict[tuple, tuple] = {}
+        self.ssl_context = _SSL_CONTEXT
     
     def parse_wind_from_raw(self, raw_text: str) -> Optional[Dict[str, Optional[float]]]:
         """
@@ -37,10 +64,7 @@ class AviationWeatherAPI:
         if not raw_text or not isinstance(raw_text, str):
             return None
         
-        # Pattern: 3-digit direction (or VRB), 2-3 digit speed, optional G (gusts), KT
-        # Examples: "12015KT", "VRB05KT", "00000KT", "12015G25KT"
-        wind_pattern = r'\b(\d{3}|VRB)(\d{2,3})(?:G(\d{2,3}))?KT\b'
-        match = re.search(wind_pattern, raw_text)
+        match = _WIND_RE.search(raw_text)
         
         if match:
             direction_str = match.group(1)
@@ -55,7 +79,9 @@ class AviationWeatherAPI:
         
         return None
     
-    def parse_visibility(self, visib) -> Optional[float]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse_visibility(visib) -> Optional[float]:
         """
         Parse visibility string to float (statute miles)
         
@@ -79,30 +105,37 @@ class AviationWeatherAPI:
             return None
         
         visib = visib.strip()
+        if not visib:
+            return None
         
         # Handle "10+", "6+" format (remove + and convert)
-        if visib.endswith('+'):
+        if visib[-1] == '+':
             try:
                 return float(visib[:-1])
             except ValueError:
                 pass
         
-        # Handle "P6SM" format (P means "plus", SM is statute miles)
-        if visib.startswith('P') and 'SM' in visib:
-            match = re.search(r'P(\d+)SM', visib)
-            if match:
-                try:
+        # Dispatch on the first character
+        first = visib[0]
+        if first == 'P':
+            # Handle "P6SM" format (P means "plus", SM is statute miles)
+            if 'SM' in visib:
+                match = _P_SM_RE.search(visib)
+                if match:
                     return float(match.group(1))
-                except ValueError:
-                    pass
-        
-        # Handle "M1/4" format (M means "less than")
-        if visib.startswith('M'):
+        elif first == 'M':
+            # Handle "M1/4" format (M means "less than")
             visib = visib[1:]  # Remove M prefix
+        elif first.isdigit() and '/' not in visib:
+            # Plain number like "10" or "6.5" - no fraction to match
+            try:
+                return float(visib)
+            except ValueError:
+                return None
         
         # Handle fractions like "1/2", "1 1/2"
         # Pattern: optional whole number, space, fraction
-        fraction_match = re.match(r'(\d+)?\s*(\d+)/(\d+)', visib)
+        fraction_match = _FRACTION_RE.match(visib)
         if fraction_match:
             whole = int(fraction_match.group(1) or 0)
             numerator = int(fraction_match.group(2))
@@ -118,7 +151,9 @@ class AviationWeatherAPI:
         
         return None
     
-    def visibility_to_miles(self, vis_str: Optional[str]) -> Optional[float]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def visibility_to_miles(vis_str: Optional[str]) -> Optional[float]:
         """
         Convert visibility string to numeric (e.g., 'P6SM' -> 6, '3SM' -> 3, '9999' -> 10)
         Used for TAF parsing
@@ -148,23 +183,32 @@ class AviationWeatherAPI:
         Parse TAF string using metar_taf_parser to extract detailed forecast data
         with change groups (FM, TEMPO, BECMG, PROB)
         
-        Returns a list of forecast data points with time series information
+        Returns a list of forecast data points with time series information.
+        Results are cached per TAF string and UTC hour, so callers must treat
+        the returned list as read-only.
         """
         if not taf_string or not isinstance(taf_string, str):
             return None
         
+        # The same TAF is re-fetched every poll until the next issue; the current
+        # hour is part of the key because it anchors the validity dates
+        return self._parse_taf_cached(taf_string, datetime.utcnow().replace(minute=0, second=0, microsecond=0))
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _parse_taf_cached(taf_string: str, now: datetime) -> Optional[List[Dict]]:
+        """Parse a TAF string relative to `now` (see parse_taf_with_change_groups)"""
         try:
             # Parse the TAF
             taf = TAFParser().parse(taf_string)
             
-            if not taf or not hasattr(taf, 'validity'):
+            validity = getattr(taf, 'validity', None) if taf else None
+            if validity is None:
                 return None
             
-            # Get current date/time for base validity period
-            now = datetime.utcnow()
             # Extract day and hour from TAF validity
-            validity_start_day = taf.validity.start_day if hasattr(taf.validity, 'start_day') else now.day
-            validity_start_hour = taf.validity.start_hour if hasattr(taf.validity, 'start_hour') else now.hour
+            validity_start_day = getattr(validity, 'start_day', now.day)
+            validity_start_hour = getattr(validity, 'start_hour', now.hour)
             
             # Adjust year/month if TAF day is in the past (next month)
             base_year = now.year
@@ -176,31 +220,32 @@ class AviationWeatherAPI:
                     base_year += 1
             
             base_start = datetime(base_year, base_month, validity_start_day, validity_start_hour)
+            # Every other time is an offset from base_start; a day-of-month earlier than the
+            # start day means the period ran into the next month
+            base_month_days = calendar.monthrange(base_year, base_month)[1]
             
             # Get end time
-            validity_end_day = taf.validity.end_day if hasattr(taf.validity, 'end_day') else validity_start_day
-            validity_end_hour = taf.validity.end_hour if hasattr(taf.validity, 'end_hour') else validity_start_hour
+            validity_end_day = getattr(validity, 'end_day', validity_start_day)
+            validity_end_hour = getattr(validity, 'end_hour', validity_start_hour)
             
             # Handle day rollover
-            if validity_end_day < validity_start_day or (validity_end_day == validity_start_day and validity_end_hour < validity_start_hour):
-                validity_end_day += 1
+            end_days = validity_end_day - validity_start_day
+            if end_days < 0:
+                end_days += base_month_days
+            elif end_days == 0 and validity_end_hour < validity_start_hour:
+                end_days = 1
             
-            base_end = datetime(base_year, base_month, validity_end_day, validity_end_hour)
+            base_end = base_start + timedelta(days=end_days, hours=validity_end_hour - validity_start_hour)
             
             # Collect data points: time and visibility for base + each trend
             data = []
             
             # Extract base forecast values
-            base_vis = self.visibility_to_miles(
-                taf.visibility.distance if hasattr(taf, 'visibility') and taf.visibility else None
-            )
-            base_wind_speed = None
-            base_wind_dir = None
-            if hasattr(taf, 'wind') and taf.wind:
-                if hasattr(taf.wind, 'speed'):
-                    base_wind_speed = taf.wind.speed
-                if hasattr(taf.wind, 'direction'):
-                    base_wind_dir = taf.wind.direction
+            base_visibility = getattr(taf, 'visibility', None)
+            base_vis = AviationWeatherAPI.visibility_to_miles(base_visibility.distance if base_visibility else None)
+            base_wind = getattr(taf, 'wind', None)
+            base_wind_speed = getattr(base_wind, 'speed', None) if base_wind else None
+            base_wind_dir = getattr(base_wind, 'direction', None) if base_wind else None
             
             # Add base forecast
             data.append({
@@ -216,170 +261,190 @@ class AviationWeatherAPI:
             })
             
             # Process trends (change groups)
-            if hasattr(taf, 'trends') and taf.trends:
-                for trend in taf.trends:
-                    if not hasattr(trend, 'validity'):
-                        continue
-                    
-                    # Get trend start time
-                    trend_start_day = trend.validity.start_day if hasattr(trend.validity, 'start_day') else validity_start_day
-                    trend_start_hour = trend.validity.start_hour if hasattr(trend.validity, 'start_hour') else validity_start_hour
-                    trend_start_minutes = trend.validity.start_minutes if hasattr(trend.validity, 'start_minutes') else 0
-                    
-                    # Adjust for day rollover
-                    trend_year = base_year
-                    trend_month = base_month
-                    if trend_start_day < validity_start_day:
-                        trend_month += 1
-                        if trend_month > 12:
-                            trend_month = 1
-                            trend_year += 1
-                    
-                    trend_start = datetime(trend_year, trend_month, trend_start_day, trend_start_hour, trend_start_minutes)
-                    
-                    # Get end time if applicable
-                    trend_end = trend_start
-                    if hasattr(trend.validity, 'end_hour'):
-                        trend_end_day = trend.validity.end_day if hasattr(trend.validity, 'end_day') else trend_start_day
-                        trend_end_hour = trend.validity.end_hour
-                        trend_end_minutes = trend.validity.end_minutes if hasattr(trend.validity, 'end_minutes') else 0
-                        
-                        if trend_end_day < trend_start_day or (trend_end_day == trend_start_day and trend_end_hour < trend_start_hour):
-                            trend_end_day += 1
-                        
-                        trend_end = datetime(trend_year, trend_month, trend_end_day, trend_end_hour, trend_end_minutes)
-                    
-                    # Extract trend values
-                    trend_vis = self.visibility_to_miles(
-                        trend.visibility.distance if hasattr(trend, 'visibility') and trend.visibility else None
-                    ) or base_vis
-                    
-                    trend_wind_speed = None
-                    trend_wind_dir = None
-                    if hasattr(trend, 'wind') and trend.wind:
-                        if hasattr(trend.wind, 'speed'):
-                            trend_wind_speed = trend.wind.speed
-                        if hasattr(trend.wind, 'direction'):
-                            trend_wind_dir = trend.wind.direction
+            for trend in getattr(taf, 'trends', None) or ():
+                trend_validity = getattr(trend, 'validity', None)
+                if trend_validity is None:
+                    continue
+                
+                # Get trend start time
+                trend_start_day = getattr(trend_validity, 'start_day', validity_start_day)
+                trend_start_hour = getattr(trend_validity, 'start_hour', validity_start_hour)
+                trend_start_minutes = getattr(trend_validity, 'start_minutes', 0)
+                
+                # Adjust for day rollover
+                start_days = trend_start_day - validity_start_day
+                if start_days < 0:
+                    start_days += base_month_days
+                
+                trend_start = base_start + timedelta(
+                    days=start_days,
+                    hours=trend_start_hour - validity_start_hour,
+                    minutes=trend_start_minutes
+                )
+                
+                # Get end time if applicable
+                trend_end = trend_start
+                trend_end_hour = getattr(trend_validity, 'end_hour', None)
+                if trend_end_hour is not None:
+                    trend_end_day = getattr(trend_validity, 'end_day', trend_start_day)
+                    trend_end_minutes = getattr(trend_validity, 'end_minutes', 0)
                     
-                    trend_ceiling = None
-                    if hasattr(trend, 'clouds') and trend.clouds:
-                        # Get lowest ceiling
-                        for cloud in trend.clouds:
-                            if hasattr(cloud, 'base') and cloud.base:
-                                if trend_ceiling is None or cloud.base < trend_ceiling:
-                                    trend_ceiling = cloud.base
+                    end_days = trend_end_day - trend_start_day
+                    if end_days < 0:
+                        end_days += base_month_days
+                    elif end_days == 0 and trend_end_hour < trend_start_hour:
+                        end_days = 1
                     
-                    data.append({
-                        'time': trend_start,
-                        'end_time': trend_end,
-                        'vis': trend_vis,
-                        'wind_speed': trend_wind_speed or base_wind_speed,
-                        'wind_direction': trend_wind_dir or base_wind_dir,
-                        'type': trend.type if hasattr(trend, 'type') else 'UNKNOWN',
-                        'prob': trend.probability if hasattr(trend, 'probability') else None,
-                        'ceiling': trend_ceiling,
-                        'flight_category': None  # Could be calculated from vis/ceiling
-                    })
+                    trend_end = trend_start + timedelta(
+                        days=end_days,
+                        hours=trend_end_hour - trend_start_hour,
+                        minutes=trend_end_minutes - trend_start_minutes
+                    )
+                
+                # Extract trend values
+                trend_visibility = getattr(trend, 'visibility', None)
+                trend_vis = AviationWeatherAPI.visibility_to_miles(
+                    trend_visibility.distance if trend_visibility else None
+                ) or base_vis
+                
+                trend_wind = getattr(trend, 'wind', None)
+                trend_wind_speed = getattr(trend_wind, 'speed', None) if trend_wind else None
+                trend_wind_dir = getattr(trend_wind, 'direction', None) if trend_wind else None
+                
+                # Get lowest ceiling
+                trend_ceiling = min(
+                    (cloud.base for cloud in getattr(trend, 'clouds', None) or () if getattr(cloud, 'base', None)),
+                    default=None
+                )
+                
+                data.append({
+                    'time': trend_start,
+                    'end_time': trend_end,
+                    'vis': trend_vis,
+                    'wind_speed': trend_wind_speed or base_wind_speed,
+                    'wind_direction': trend_wind_dir or base_wind_dir,
+                    'type': getattr(trend, 'type', 'UNKNOWN'),
+                    'prob': getattr(trend, 'probability', None),
+                    'ceiling': trend_ceiling,
+                    'flight_category': None  # Could be calculated from vis/ceiling
+                })
             
-            # Create a pandas DataFrame for time series
-            df = pd.DataFrame(data)
-            df['time'] = pd.to_datetime(df['time'])
-            df['end_time'] = pd.to_datetime(df['end_time'])
-            df = df.sort_values('time')
+            # Order base + trends by start time and split into columns (no DataFrame needed)
+            data.sort(key=lambda row: row['time'])
+            starts = np.array([row['time'] for row in data], dtype='datetime64[ns]')
+            ends = np.array([row['end_time'] for row in data], dtype='datetime64[ns]')
+            types = [row['type'] for row in data]
+            trend_vis = [row['vis'] for row in data]
+            trend_wind_speed = [row['wind_speed'] for row in data]
+            trend_wind_dir = [row['wind_direction'] for row in data]
+            trend_ceiling = [row['ceiling'] for row in data]
             
-            # Generate a full timeline (hourly for smoothness)
-            timeline = pd.date_range(base_start, base_end, freq='h')
-            forecast_points = []
+            # Generate a full timeline (hourly for smoothness), both ends inclusive
+            hours = np.arange(
+                np.datetime64(base_start, 'h'),
+                np.datetime64(base_end, 'h') + np.timedelta64(1, 'h'),
+                dtype='datetime64[h]'
+            )
+            
+            # active[k, i]: trend i has started by hour k and not yet ended (or is open-ended)
+            active = (starts[None, :] <= hours[:, None]) & (np.isnat(ends)[None, :] | (ends[None, :] >= hours[:, None]))
+            # Last applicable trend (in start-time order) for every hour, -1 when none is active
+            last_active = np.where(
+                active.any(axis=1),
+                len(starts) - 1 - np.argmax(active[:, ::-1], axis=1),
+                -1
+            )
+            
+            # BECMG interpolation fraction for each hour's trend, clamped to [0, 1]; only
+            # used where that trend ends after it starts
+            sel = np.maximum(last_active, 0)
+            span = ends[sel] - starts[sel]
+            gradual = (span > np.timedelta64(0, 'ns')).tolist()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                frac = np.clip((hours - starts[sel]) / span, 0, 1).tolist()
             
-            # Apply changes over time (simple step for FM/TEMPO; interpolate for BECMG)
+            # Apply changes over time (simple step for FM/TEMPO; interpolate for BECMG).
+            # BECMG blends from the previous hour's state, so this part stays sequential.
             current_vis = base_vis
             current_wind_speed = base_wind_speed
             current_wind_dir = base_wind_dir
             current_ceiling = None
+            hourly = []
             
-            for t in timeline:
-                # Find active trends at this time
-                active_trends = df[(df['time'] <= t) & ((pd.isna(df['end_time'])) | (df['end_time'] >= t))]
-                if not active_trends.empty:
-                    latest = active_trends.iloc[-1]  # Last applicable
+            for k, i in enumerate(last_active.tolist()):
+                if i >= 0:
+                    trend_type = types[i]
                     
-                    if latest['type'] == 'FM':
-                        # Abrupt change
-                        current_vis = latest['vis']
-                        current_wind_speed = latest['wind_speed']
-                        current_wind_dir = latest['wind_direction']
-                        current_ceiling = latest['ceiling']
-                    elif latest['type'] == 'BECMG':
+                    if trend_type == 'BECMG' and gradual[k]:
                         # Gradual change - simple linear interpolation
-                        if pd.notna(latest['end_time']) and pd.notna(latest['time']) and latest['end_time'] > latest['time']:
-                            frac = (t - latest['time']) / (latest['end_time'] - latest['time'])
-                            frac = max(0, min(1, frac))  # Clamp between 0 and 1
-                            
-                            prev_vis = current_vis or 0
-                            new_vis = latest['vis'] or 0
-                            current_vis = prev_vis + frac * (new_vis - prev_vis)
-                            
-                            if latest['wind_speed'] is not None:
-                                prev_wind = current_wind_speed or 0
-                                new_wind = latest['wind_speed'] or 0
-                                current_wind_speed = prev_wind + frac * (new_wind - prev_wind)
-                            
-                            if latest['wind_direction'] is not None:
-                                prev_dir = current_wind_dir or 0
-                                new_dir = latest['wind_direction'] or 0
-                                # Handle direction wrap-around
-                                diff = new_dir - prev_dir
-                                if diff > 180:
-                                    diff -= 360
-                                elif diff < -180:
-                                    diff += 360
-                                current_wind_dir = prev_dir + frac * diff
-                        else:
-                            current_vis = latest['vis']
-                            current_wind_speed = latest['wind_speed']
-                            current_wind_dir = latest['wind_direction']
-                            current_ceiling = latest['ceiling']
-                    elif latest['type'] in ['TEMPO', 'PROB']:
-                        # Temporary override
-                        current_vis = latest['vis']
-                        current_wind_speed = latest['wind_speed']
-                        current_wind_dir = latest['wind_direction']
-                        current_ceiling = latest['ceiling']
-                
-                # Calculate flight category from visibility and ceiling
-                flight_category = None
-                if current_vis is not None and current_ceiling is not None:
-                    if current_vis >= 5.0 and current_ceiling >= 3000:
-                        flight_category = 'VFR'
-                    elif current_vis >= 3.0 and current_ceiling >= 1000:
-                        flight_category = 'MVFR'
-                    elif current_vis >= 1.0 and current_ceiling >= 500:
-                        flight_category = 'IFR'
-                    else:
-                        flight_category = 'LIFR'
-                elif current_vis is not None:
-                    if current_vis >= 5.0:
-                        flight_category = 'VFR'
-                    elif current_vis >= 3.0:
-                        flight_category = 'MVFR'
-                    elif current_vis >= 1.0:
-                        flight_category = 'IFR'
-                    else:
-                        flight_category = 'LIFR'
+                        f = frac[k]
+                        
+                        prev_vis = current_vis or 0
+                        new_vis = trend_vis[i] or 0
+                        current_vis = prev_vis + f * (new_vis - prev_vis)
+                        
+                        if trend_wind_speed[i] is not None:
+                            prev_wind = current_wind_speed or 0
+                            new_wind = trend_wind_speed[i] or 0
+                            current_wind_speed = prev_wind + f * (new_wind - prev_wind)
+                        
+                        if trend_wind_dir[i] is not None:
+                            prev_dir = current_wind_dir or 0
+                            new_dir = trend_wind_dir[i] or 0
+                            # Handle direction wrap-around
+                            diff = new_dir - prev_dir
+                            if diff > 180:
+                                diff -= 360
+                            elif diff < -180:
+                                diff += 360
+                            current_wind_dir = prev_dir + f * diff
+                    elif trend_type in ('FM', 'BECMG', 'TEMPO', 'PROB'):
+                        # Abrupt change (FM, BECMG without an end time) or temporary override
+                        current_vis = trend_vis[i]
+                        current_wind_speed = trend_wind_speed[i]
+                        current_wind_dir = trend_wind_dir[i]
+                        current_ceiling = trend_ceiling[i]
                 
-                forecast_points.append({
-                    'time': t.isoformat() + 'Z',
-                    'valid_from': t.isoformat() + 'Z',
-                    'valid_to': (t + timedelta(hours=1)).isoformat() + 'Z',
+                hourly.append((current_vis, current_wind_speed, current_wind_dir, current_ceiling))
+            
+            # Calculate flight category from visibility and ceiling for all hours at once;
+            # without a ceiling only visibility counts
+            vis_arr = np.array([np.nan if h[0] is None else h[0] for h in hourly], dtype=float)
+            ceil_arr = np.array([np.nan if h[3] is None else h[3] for h in hourly], dtype=float)
+            no_ceiling = np.isnan(ceil_arr)
+            flight_categories = np.select(
+                [
+                    np.isnan(vis_arr),
+                    (vis_arr >= 5.0) & (no_ceiling | (ceil_arr >= 3000)),
+                    (vis_arr >= 3.0) & (no_ceiling | (ceil_arr >= 1000)),
+                    (vis_arr >= 1.0) & (no_ceiling | (ceil_arr >= 500)),
+                ],
+                [None, 'VFR', 'MVFR', 'IFR'],
+                default='LIFR'
+            ).tolist()
+            
+            # Hourly steps: each hour's valid_to is the next hour's valid_from, so all
+            # boundaries (plus the end of the last hour) are formatted in one call
+            boundaries = np.append(hours, hours[-1:] + np.timedelta64(1, 'h'))
+            hour_stamps = [stamp + 'Z' for stamp in np.datetime_as_string(boundaries, unit='s').tolist()]
+            
+            # Materialize the per-hour dicts once from the columnar results
+            forecast_points = [
+                {
+                    'time': valid_from,
+                    'valid_from': valid_from,
+                    'valid_to': valid_to,
                     'temperature': None,
-                    'wind_speed': current_wind_speed,
-                    'wind_direction': current_wind_dir,
-                    'visibility': current_vis,
-                    'ceiling': current_ceiling,
+                    'wind_speed': wind_speed,
+                    'wind_direction': wind_dir,
+                    'visibility': vis,
+                    'ceiling': ceiling,
                     'flight_category': flight_category,
                     'conditions': ''
-                })
+                }
+                for valid_from, valid_to, (vis, wind_speed, wind_dir, ceiling), flight_category
+                in zip(hour_stamps, hour_stamps[1:], hourly, flight_categories)
+            ]
             
             return forecast_points
             
@@ -391,11 +456,58 @@ class AviationWeatherAPI:
     
     async def get_session(self):
         if self.session is None or self.session.closed:
-            # Create connector with SSL verification disabled
-            connector = aiohttp.TCPConnector(ssl=self.ssl_context)
-            self.session = aiohttp.ClientSession(connector=connector)
+            # Create connector with SSL verification disabled; keep sockets alive between
+            # polls and cache DNS so repeat requests skip the TCP/TLS handshake
+            connector = aiohttp.TCPConnector(
+                ssl=self.ssl_context,
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
         return self.session
     
+    async def warmup(self):
+        """Open the session and one pooled connection so the first real request skips the handshake"""
+        try:
+            session = await self.get_session()
+            async with session.head(self.BASE_URL) as response:
+                await response.release()
+        except Exception as e:
+            print(f"Weather API warmup failed: {e}")
+    
+    def _cache_get(self, key: tuple):
+        """Return a cached result if it is younger than its product's CACHE_TTL_SECONDS, else None"""
+        entry = self._cache.get(key)
+        if entry and time.monotonic() - entry[0] < self.CACHE_TTL_SECONDS[key[0]]:
+            return entry[1]
+        return None
+    
+    def _cache_put(self, key: tuple, result):
+        """Store a result in the TTL cache, sweeping expired entries when it gets large"""
+        now = time.monotonic()
+        if len(self._cache) >= self.CACHE_SWEEP_THRESHOLD:
+            self._cache = {
+                k: entry for k, entry in self._cache.items()
+                if now - entry[0] < self.CACHE_TTL_SECONDS[k[0]]
+            }
+        self._cache[key] = (now, result)
+    
+    async def _cached(self, key: tuple, fetch):
+        """Serve key from the TTL cache, or await fetch() and cache a non-empty result"""
+        result = self._cache_get(key)
+        if result is not None:
+            return result
+        result = await fetch()
+        if result:
+            self._cache_put(key, result)
+        return result
+    
     async def get_metar(self, station_id: str) -> Optional[Dict]:
         """
         Get current METAR (weather observation) for airport
@@ -406,11 +518,38 @@ class AviationWeatherAPI:
         Returns:
             Dict with parsed METAR data or None if unavailable
         """
+        return (await self.get_metars([station_id])).get(station_id)
+    
+    async def get_metars(self, station_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Get current METARs for several airports, fetching all uncached ones in one request
+        
+        Args:
+            station_ids: Airport ICAO codes (e.g., ["KJFK", "KEWR", "KLGA"])
+        
+        Returns:
+            Dict mapping each requested station ID to its parsed METAR (None if unavailable)
+        """
+        results = {station_id: self._cache_get(("metar", station_id)) for station_id in station_ids}
+        missing = [station_id for station_id, metar in results.items() if metar is None]
+        if not missing:
+            return results
+        
+        fetched = await self._fetch_metars(missing)
+        for station_id in missing:
+            metar = fetched.get(station_id.upper())
+            if metar:
+                self._cache_put(("metar", station_id), metar)
+            results[station_id] = metar
+        return results
+    
+    async def _fetch_metars(self, station_ids: List[str]) -> Dict[str, Dict]:
+        """Fetch and parse the latest METAR per station in a single API call (uncached)"""
         session = await self.get_session()
         
-        # Get most recent METAR from last 2 hours
+        # Get most recent METARs from last 2 hours; the API takes comma-separated ids
         params = {
-            "ids": station_id,
+            "ids": ",".join(station_ids),
             "format": "json",
             "taf": "false",
             "hours": 2,
@@ -422,96 +561,88 @@ class AviationWeatherAPI:
             async with session.get(url, params=params, timeout=10) as response:
                 if response.status != 200:
                     print(f"Weather API error: {response.status}")
-                    return None
+                    return {}
                 
-                data = await response.json()
+                data = await response.json(loads=orjson.loads)
                 
                 if not data or len(data) == 0:
-                    return None
-                
-                # Get most recent METAR
-                metar = data[0]
+                    return {}
                 
-                # Debug: Print the raw METAR response to see available fields
-                print(f"DEBUG: Raw METAR response keys: {list(metar.keys())}")
-                print(f"DEBUG: METAR wspd value: {metar.get('wspd')}")
-                print(f"DEBUG: METAR wdir value: {metar.get('wdir')}")
-                print(f"DEBUG: METAR rawOb: {metar.get('rawOb')}")
-                
-                # Get wind speed from API response
-                wind_speed = metar.get("wspd")
-                wind_direction = metar.get("wdir")
-                
-                print(f"DEBUG: wind_speed type: {type(wind_speed)}, value: {wind_speed}")
-                print(f"DEBUG: wind_direction type: {type(wind_direction)}, value: {wind_direction}")
-                
-                # Convert string values to float if needed
-                if isinstance(wind_speed, str):
-                    try:
-                        wind_speed = float(wind_speed)
-                        print(f"DEBUG: Converted wind_speed from string to float: {wind_speed}")
-                    except (ValueError, TypeError):
-                        wind_speed = None
-                        print(f"DEBUG: Failed to convert wind_speed string to float")
-                elif wind_speed is not None:
-                    # Ensure it's a number type
-                    try:
-                        wind_speed = float(wind_speed)
-                    except (ValueError, TypeError):
-                        print(f"DEBUG: Failed to convert wind_speed to float, keeping as: {wind_speed}")
-                
-                if isinstance(wind_direction, str):
-                    try:
-                        wind_direction = float(wind_direction)
-                    except (ValueError, TypeError):
-                        wind_direction = None
-                elif wind_direction is not None:
-                    try:
-                        wind_direction = float(wind_direction)
-                    except (ValueError, TypeError):
-                        pass
-                
-                # If wind speed is None or 0, try to parse from raw METAR text as fallback
-                raw_text = metar.get("rawOb", "")
-                if raw_text:
-                    parsed_wind = self.parse_wind_from_raw(raw_text)
-                    if parsed_wind and parsed_wind.get("speed") is not None:
-                        # Use parsed value if API value is None, or if API says 0 but raw shows non-zero
-                        if wind_speed is None:
-                            wind_speed = parsed_wind["speed"]
-                            if wind_direction is None and parsed_wind.get("direction") is not None:
-                                wind_direction = parsed_wind["direction"]
-                            print(f"DEBUG: Parsed wind from raw METAR (wspd was None): speed={wind_speed}, direction={wind_direction}")
-                        elif wind_speed == 0 and parsed_wind["speed"] > 0:
-                            # API says 0 but raw METAR shows non-zero wind - use raw value
-                            wind_speed = parsed_wind["speed"]
-                            if wind_direction is None and parsed_wind.get("direction") is not None:
-                                wind_direction = parsed_wind["direction"]
-                            print(f"DEBUG: Parsed wind from raw METAR (wspd was 0 but raw shows {wind_speed}): speed={wind_speed}, direction={wind_direction}")
-                
-                # Check for alternative wind speed field names as last resort
-                if wind_speed is None:
-                    wind_speed = metar.get("windSpeed") or metar.get("wind_speed") or metar.get("windspeed")
-                    if wind_speed is not None:
-                        print(f"DEBUG: Found wind speed in alternative field: {wind_speed}")
-                
-                return {
-                    "station": metar.get("icaoId"),
-                    "observation_time": metar.get("obsTime"),
-                    "raw_text": metar.get("rawOb"),
-                    "temperature": metar.get("temp"),  # Celsius
-                    "dewpoint": metar.get("dewp"),     # Celsius
-                    "wind_speed": wind_speed,   # Knots
-                    "wind_direction": wind_direction, # Degrees
-                    "visibility": self.parse_visibility(metar.get("visib")),  # Statute miles
-                    "ceiling": metar.get("cig"),       # Feet AGL
-                    "flight_category": metar.get("fltcat"),  # VFR, MVFR, IFR, LIFR
-                    "conditions": metar.get("wxString", ""),  # Weather phenomena
-                }
+                # Observations come newest first, so keep the first one per station
+                latest = {}
+                for metar in data:
+                    station = metar.get("icaoId")
+                    if station and station not in latest:
+                        latest[station] = self._parse_metar(metar)
+                return latest
         
         except Exception as e:
             print(f"METAR fetch error: {e}")
-            return None
+            return {}
+    
+    def _parse_metar(self, metar: Dict) -> Dict:
+        """Normalize one METAR record from the API"""
+        # Get wind speed from API response
+        wind_speed = metar.get("wspd")
+        wind_direction = metar.get("wdir")
+        
+        # Convert string values to float if needed
+        if isinstance(wind_speed, str):
+            try:
+                wind_speed = float(wind_speed)
+            except (ValueError, TypeError):
+                wind_speed = None
+        elif wind_speed is not None:
+            # Ensure it's a number type
+            try:
+                wind_speed = float(wind_speed)
+            except (ValueError, TypeError):
+                pass
+        
+        if isinstance(wind_direction, str):
+            try:
+                wind_direction = float(wind_direction)
+            except (ValueError, TypeError):
+                wind_direction = None
+        elif wind_direction is not None:
+            try:
+                wind_direction = float(wind_direction)
+            except (ValueError, TypeError):
+                pass
+        
+        # If wind speed is None or 0, try to parse from raw METAR text as fallback
+        raw_text = metar.get("rawOb", "")
+        if raw_text:
+            parsed_wind = self.parse_wind_from_raw(raw_text)
+            if parsed_wind and parsed_wind.get("speed") is not None:
+                # Use parsed value if API value is None, or if API says 0 but raw shows non-zero
+                if wind_speed is None:
+                    wind_speed = parsed_wind["speed"]
+                    if wind_direction is None and parsed_wind.get("direction") is not None:
+                        wind_direction = parsed_wind["direction"]
+                elif wind_speed == 0 and parsed_wind["speed"] > 0:
+                    # API says 0 but raw METAR shows non-zero wind - use raw value
+                    wind_speed = parsed_wind["speed"]
+                    if wind_direction is None and parsed_wind.get("direction") is not None:
+                        wind_direction = parsed_wind["direction"]
+        
+        # Check for alternative wind speed field names as last resort
+        if wind_speed is None:
+            wind_speed = metar.get("windSpeed") or metar.get("wind_speed") or metar.get("windspeed")
+        
+        return {
+            "station": metar.get("icaoId"),
+            "observation_time": metar.get("obsTime"),
+            "raw_text": metar.get("rawOb"),
+            "temperature": metar.get("temp"),  # Celsius
+            "dewpoint": metar.get("dewp"),     # Celsius
+            "wind_speed": wind_speed,   # Knots
+            "wind_direction": wind_direction, # Degrees
+            "visibility": self.parse_visibility(metar.get("visib")),  # Statute miles
+            "ceiling": metar.get("cig"),       # Feet AGL
+            "flight_category": metar.get("fltcat"),  # VFR, MVFR, IFR, LIFR
+            "conditions": metar.get("wxString", ""),  # Weather phenomena
+        }
     
     async def get_sigmets(self, hazard: str = None) -> List[Dict]:
         """
@@ -523,6 +654,10 @@ class AviationWeatherAPI:
         Returns:
             List of active SIGMETs
         """
+        return await self._cached(("sigmet", hazard), lambda: self._fetch_sigmets(hazard))
+    
+    async def _fetch_sigmets(self, hazard: str = None) -> List[Dict]:
+        """Fetch active SIGMETs from the API (uncached)"""
         session = await self.get_session()
         
         params = {
@@ -539,7 +674,7 @@ class AviationWeatherAPI:
                 if response.status != 200:
                     return []
                 
-                data = await response.json()
+                data = await response.json(loads=orjson.loads)
                 
                 sigmets = []
                 for sigmet in data:
@@ -571,6 +706,23 @@ class AviationWeatherAPI:
         Returns:
             Dict with TAF data or None if unavailable
         """
+        return await self._cached(("taf", station_id), lambda: self._fetch_taf(station_id))
+    
+    async def get_tafs(self, station_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Get TAFs for several airports with all uncached requests in flight at once
+        
+        Args:
+            station_ids: Airport ICAO codes
+        
+        Returns:
+            Dict mapping each requested station ID to its TAF data (None if unavailable)
+        """
+        tafs = await asyncio.gather(*(self.get_taf(station_id) for station_id in station_ids))
+        return dict(zip(station_ids, tafs))
+    
+    async def _fetch_taf(self, station_id: str) -> Optional[Dict]:
+        """Fetch and parse the TAF from the API (uncached)"""
         session = await self.get_session()
         
         params = {
@@ -587,7 +739,7 @@ class AviationWeatherAPI:
                 if response.status != 200:
                     return None
                 
-                data = await response.json()
+                data = await response.json(loads=orjson.loads)
                 
                 if not data or len(data) == 0:
                     return None
@@ -642,6 +794,43 @@ class AviationWeatherAPI:
             print(f"TAF fetch error: {e}")
             return None
     
+    async def get_weather_bundle(self, station_id: str, hazard: str = None) -> Dict:
+        """
+        Get METAR, TAF and SIGMETs for an airport with the three requests in flight at once
+        
+        Args:
+            station_id: Airport ICAO code
+            hazard: Optional SIGMET hazard filter
+        
+        Returns:
+            Dict with "metar", "taf" and "sigmets" keys
+        """
+        metar, taf, sigmets = await asyncio.gather(
+            self.get_metar(station_id),
+            self.get_taf(station_id),
+            self.get_sigmets(hazard)
+        )
+        return {"metar": metar, "taf": taf, "sigmets": sigmets}
+    
+    async def get_weather_bundles(self, station_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get METAR and TAF for several airports, fetching METARs and TAFs concurrently
+        
+        Args:
+            station_ids: Airport ICAO codes (at most MAX_BUNDLE_STATIONS)
+        
+        Returns:
+            Dict mapping each station ID to a {"metar", "taf"} dict
+        """
+        metars, tafs = await asyncio.gather(
+            self.get_metars(station_ids),
+            self.get_tafs(station_ids)
+        )
+        return {
+            station_id: {"metar": metars.get(station_id), "taf": tafs.get(station_id)}
+            for station_id in station_ids
+        }
+    
     async def close(self):
         if self.session and not self.session.closed:
             await self.session.close()